@@ -1,8 +1,45 @@
+import re
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
+from django.db.models import Q
+from core.paginators import EstimatedCountPaginator
 from .models import CustomUser
 
 
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+
+def user_search_filter(term):
+    """
+    Build an index-friendly lookup for an admin search term based on its shape.
+
+    - Full email         -> exact (case-insensitive) email match
+    - Partial email      -> email prefix
+    - 10 digits          -> exact mobile number (unique index)
+    - Other digits       -> mobile number prefix
+    - "first last"       -> first name prefix AND last name prefix
+    - Single word        -> username / first name / last name prefix
+    """
+    if "@" in term:
+        if EMAIL_RE.match(term):
+            return Q(email__iexact=term)
+        return Q(email__istartswith=term)
+
+    if term.isdigit():
+        if len(term) == 10:
+            return Q(mobile_no=term)
+        return Q(mobile_no__startswith=term)
+
+    words = term.split()
+    if len(words) > 1:
+        return Q(first_name__istartswith=words[0]) & Q(last_name__istartswith=words[-1])
+    return (
+        Q(username__istartswith=term)
+        | Q(first_name__istartswith=term)
+        | Q(last_name__istartswith=term)
+    )
+
+
 @admin.register(CustomUser)
 class CustomUserAdmin(UserAdmin):
     """Admin panel configuration for CustomUser model"""
@@ -45,12 +82,25 @@ class CustomUserAdmin(UserAdmin):
     )
 
     # Search and ordering
+    # (search_fields only enables the search box; the lookup itself is
+    # chosen by `user_search_filter` so it can use an index)
     search_fields = ("email", "username", "mobile_no", "first_name", "last_name")
-    ordering = ("-created_at",)
+    search_help_text = "Email, 10-digit mobile number, username or name prefix"
+    ordering = ("-created_at",)  # backed by customuser_created_at_idx
+
+    # Pagination: estimated totals instead of COUNT(*) on every page
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        """Search one indexed column picked from the shape of the input."""
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        return queryset.filter(user_search_filter(term)), False
 
-    def get_object(self, request, object_id, from_field=None):
+    def render_change_form(self, request, context, add=False, change=False, form_url="", obj=None):
         """Show custom header in admin detail view"""
-        obj = super().get_object(request, object_id, from_field)
-        if obj:
-            obj._meta.verbose_name = f"User: {obj.username}"
-        return obj
+        if obj is not None:
+            context["title"] = f"User: {obj.username}"
+        return super().render_change_form(request, context, add, change, form_url, obj)
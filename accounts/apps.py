@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class AccountsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "accounts"
+
+    def ready(self):
+        from core.caching import invalidate_on_change, invalidate_on_m2m_change
+        from .models import CustomUser
+
+        # Cached profile data is tagged `user:<id>` (and includes groups and permissions)
+        invalidate_on_change(CustomUser, lambda user: [f"user:{user.pk}"])
+        invalidate_on_m2m_change(CustomUser.groups, lambda user: [f"user:{user.pk}"])
+        invalidate_on_m2m_change(CustomUser.user_permissions, lambda user: [f"user:{user.pk}"])
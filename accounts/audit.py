@@ -0,0 +1,239 @@
+"""
+Buffered authentication audit log.
+
+Views call `record_event(...)`, which only appends to an in-process ring
+buffer; a background thread drains it every `AUDIT_FLUSH_INTERVAL` seconds
+(or as soon as `AUDIT_FLUSH_BATCH_SIZE` events are waiting) and writes each
+batch with one bulk insert. Requests never wait on the audit write.
+
+- Memory is bounded by `AUDIT_BUFFER_SIZE`: when the buffer is full the
+  oldest event is overwritten and counted in `stats()["dropped"]`, as are
+  batches the sink failed to write.
+- Sinks (`AUDIT_LOG_SINK`): "database" bulk-inserts `AuthEvent` rows;
+  "jsonl" appends to one file per day, `AUDIT_LOG_DIR/auth-YYYY-MM-DD.jsonl`.
+- Events still buffered at interpreter exit are flushed by an atexit hook;
+  a hard kill loses at most one flush interval of events.
+"""
+import atexit
+import json
+import logging
+import os
+import threading
+from collections import deque
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import close_old_connections
+from django.utils import timezone
+
+from .models import AuthEvent
+
+
+logger = logging.getLogger(__name__)
+
+
+# -------------------------------------------------------------------
+# Sinks
+# -------------------------------------------------------------------
+
+class DatabaseSink:
+    def write(self, events):
+        AuthEvent.objects.bulk_create([AuthEvent(**event) for event in events])
+
+
+class JSONLSink:
+    def __init__(self, directory):
+        self.directory = Path(directory)
+
+    def write(self, events):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        by_day = {}
+        for event in events:
+            line = json.dumps({**event, "created_at": event["created_at"].isoformat()})
+            by_day.setdefault(event["created_at"].date(), []).append(line)
+        for day, lines in by_day.items():
+            with open(self.directory / f"auth-{day.isoformat()}.jsonl", "a", encoding="utf-8") as fh:
+                fh.write("\n".join(lines) + "\n")
+
+
+def default_sink():
+    if getattr(settings, "AUDIT_LOG_SINK", "database") == "jsonl":
+        return JSONLSink(getattr(settings, "AUDIT_LOG_DIR", settings.BASE_DIR / "logs" / "audit"))
+    return DatabaseSink()
+
+
+# -------------------------------------------------------------------
+# Buffer
+# -------------------------------------------------------------------
+
+class AuditBuffer:
+    def __init__(self, sink, capacity=10000, batch_size=500, flush_interval=1.0, background=True):
+        self.sink = sink
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.background = background
+
+        self.events = deque()
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.thread = None
+        self.recorded = self.written = self.dropped = 0
+
+    def record(self, event):
+        with self.lock:
+            if len(self.events) >= self.capacity:
+                self.events.popleft()
+                self.dropped += 1
+            self.events.append(event)
+            self.recorded += 1
+            pending = len(self.events)
+
+        if self.background:
+            self.ensure_flusher()
+            if pending >= self.batch_size:
+                self.wakeup.set()
+
+    def flush(self):
+        """Write everything buffered now, in the calling thread. Returns the number written."""
+        written = 0
+        with self.flush_lock:
+            while True:
+                with self.lock:
+                    batch = [self.events.popleft() for _ in range(min(self.batch_size, len(self.events)))]
+                if not batch:
+                    return written
+                try:
+                    self.sink.write(batch)
+                except Exception:
+                    logger.exception("Dropping %d audit events: sink write failed", len(batch))
+                    with self.lock:
+                        self.dropped += len(batch)
+                else:
+                    written += len(batch)
+                    with self.lock:
+                        self.written += len(batch)
+
+    def stats(self):
+        with self.lock:
+            return {
+                "recorded": self.recorded,
+                "written": self.written,
+                "dropped": self.dropped,
+                "pending": len(self.events),
+                "capacity": self.capacity,
+            }
+
+    # ----------------------------------------------------------------
+    # Background flusher
+    # ----------------------------------------------------------------
+    def ensure_flusher(self):
+        """Start the flusher thread on first use (and again in forked workers)."""
+        if self.thread is not None and self.thread.is_alive():
+            return
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(target=self.run, name="auth-audit-flusher", daemon=True)
+                self.thread.start()
+
+    def after_fork(self):
+        # Locks may have been held by parent threads; pending events are the parent's to write
+        self.lock = threading.Lock()
+        self.flush_lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.events.clear()
+        self.thread = None
+
+    def run(self):
+        while True:
+            self.wakeup.wait(self.flush_interval)
+            self.wakeup.clear()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Audit flush failed")
+            finally:
+                close_old_connections()
+
+
+_buffer = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer():
+    """The process-wide buffer, configured from settings on first use."""
+    global _buffer
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = AuditBuffer(
+                    default_sink(),
+                    capacity=getattr(settings, "AUDIT_BUFFER_SIZE", 10000),
+                    batch_size=getattr(settings, "AUDIT_FLUSH_BATCH_SIZE", 500),
+                    flush_interval=getattr(settings, "AUDIT_FLUSH_INTERVAL", 1.0),
+                    background=getattr(settings, "AUDIT_BACKGROUND_FLUSH", True),
+                )
+    return _buffer
+
+
+def reset_buffer(flush=True):
+    """Forget the process-wide buffer (after a settings change, or between tests)."""
+    global _buffer
+    with _buffer_lock:
+        if _buffer is not None and flush:
+            _buffer.flush()
+        _buffer = None
+
+
+def flush():
+    return get_buffer().flush()
+
+
+# Registered once for the process and applied to whichever buffer is
+# current, so `reset_buffer()` never leaves hooks behind.
+def _flush_at_exit():
+    if _buffer is not None and _buffer.background:
+        _buffer.flush()
+
+
+def _after_fork_in_child():
+    global _buffer_lock
+    _buffer_lock = threading.Lock()
+    if _buffer is not None:
+        _buffer.after_fork()
+
+
+atexit.register(_flush_at_exit)
+os.register_at_fork(after_in_child=_after_fork_in_child)
+
+
+def stats():
+    return get_buffer().stats()
+
+
+# -------------------------------------------------------------------
+# Recording
+# -------------------------------------------------------------------
+
+def record_event(request, event, success, user=None, user_id=None, identifier=None):
+    """
+    Buffer one audit event for `request`.
+
+    `identifier` defaults to the login name submitted in the request body.
+    """
+    if identifier is None:
+        data = getattr(request, "data", None)
+        value = data.get(get_user_model().USERNAME_FIELD) if hasattr(data, "get") else None
+        identifier = value if isinstance(value, str) else ""
+
+    get_buffer().record({
+        "event": event,
+        "success": success,
+        "user_id": user.pk if user is not None else user_id,
+        "identifier": identifier[:255],
+        "ip": request.META.get("REMOTE_ADDR") or None,
+        "user_agent": request.META.get("HTTP_USER_AGENT", "")[:255],
+        "created_at": timezone.now(),
+    })
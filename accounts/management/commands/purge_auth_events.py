@@ -0,0 +1,35 @@
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from accounts.models import AuthEvent
+
+
+class Command(BaseCommand):
+    help = "Delete authentication audit events (rows and JSONL files) older than the retention period."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=None,
+                            help="Retention in days (defaults to AUDIT_RETENTION_DAYS).")
+
+    def handle(self, *args, **options):
+        days = options["days"] or getattr(settings, "AUDIT_RETENTION_DAYS", 90)
+        if days < 1:
+            raise CommandError("--days must be at least 1.")
+        cutoff = timezone.now() - timedelta(days=days)
+
+        deleted, _ = AuthEvent.objects.filter(created_at__lt=cutoff).delete()
+
+        removed = 0
+        directory = Path(getattr(settings, "AUDIT_LOG_DIR", settings.BASE_DIR / "logs" / "audit"))
+        for path in directory.glob("auth-*.jsonl"):
+            if path.stem.removeprefix("auth-") < cutoff.date().isoformat():
+                path.unlink()
+                removed += 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {deleted} audit event(s) and {removed} JSONL file(s) older than {days} days."
+        ))
@@ -0,0 +1,51 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:05
+
+from django.db import migrations, models
+
+
+# Prefix/case-insensitive admin search (see accounts.admin.user_search_filter).
+# Django compiles `istartswith`/`iexact` to `UPPER("col"::text) LIKE ...` and
+# `startswith` to `"col"::text LIKE ...` on PostgreSQL; these expression indexes
+# match those forms. text_pattern_ops keeps LIKE 'abc%' indexable under any
+# collation. Other backends skip this step.
+PATTERN_INDEXES = {
+    "customuser_email_upper_like": 'UPPER("email"::text) text_pattern_ops',
+    "customuser_username_upper_like": 'UPPER("username"::text) text_pattern_ops',
+    "customuser_first_name_upper_like": 'UPPER("first_name"::text) text_pattern_ops',
+    "customuser_last_name_upper_like": 'UPPER("last_name"::text) text_pattern_ops',
+    "customuser_mobile_no_like": '("mobile_no"::text) text_pattern_ops',
+}
+
+
+def create_pattern_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name, expression in PATTERN_INDEXES.items():
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "accounts_customuser" ({expression})'
+        )
+
+
+def drop_pattern_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    for name in PATTERN_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0004_alter_customuser_pin_code"),
+        ("auth", "0012_alter_user_first_name_max_length"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="customuser",
+            index=models.Index(
+                fields=["-created_at"], name="customuser_created_at_idx"
+            ),
+        ),
+        migrations.RunPython(create_pattern_indexes, drop_pattern_indexes),
+    ]
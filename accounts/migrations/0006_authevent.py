@@ -0,0 +1,72 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:26
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0005_customuser_search_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="AuthEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "event",
+                    models.CharField(
+                        choices=[
+                            ("login", "Login"),
+                            ("token_obtain", "Token obtain"),
+                            ("token_refresh", "Token refresh"),
+                            ("logout", "Logout"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("success", models.BooleanField()),
+                ("identifier", models.CharField(blank=True, max_length=255)),
+                ("ip", models.GenericIPAddressField(blank=True, null=True)),
+                ("user_agent", models.CharField(blank=True, max_length=255)),
+                ("created_at", models.DateTimeField()),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        db_constraint=False,
+                        db_index=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.DO_NOTHING,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["user", "-created_at"],
+                        name="authevent_user_created_idx",
+                    ),
+                    models.Index(
+                        fields=["ip", "-created_at"], name="authevent_ip_created_idx"
+                    ),
+                    models.Index(
+                        fields=["created_at"], name="authevent_created_at_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
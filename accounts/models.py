@@ -97,6 +97,12 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
     USERNAME_FIELD  = "email"
     REQUIRED_FIELDS = []
 
+    class Meta:
+        indexes = [
+            # Admin changelist / user listings ordered by newest first
+            models.Index(fields=["-created_at"], name="customuser_created_at_idx"),
+        ]
+
     # ----------------------------------------------------------------
     # Overrides
     # ----------------------------------------------------------------
@@ -111,3 +117,49 @@ class CustomUser(AbstractBaseUser, PermissionsMixin):
 
     def __str__(self):
         return self.email or self.username
+
+
+# -------------------------------------------------------------------
+# Authentication audit log (written in bulk by accounts.audit)
+# -------------------------------------------------------------------
+
+class AuthEvent(models.Model):
+    """
+    Append-only record of a login, token or logout attempt.
+
+    `user` has no database constraint so events outlive deleted users and
+    bulk inserts never fail on a concurrently removed account.
+    """
+
+    LOGIN = "login"
+    TOKEN_OBTAIN = "token_obtain"
+    TOKEN_REFRESH = "token_refresh"
+    LOGOUT = "logout"
+    EVENT_CHOICES = [
+        (LOGIN, "Login"),
+        (TOKEN_OBTAIN, "Token obtain"),
+        (TOKEN_REFRESH, "Token refresh"),
+        (LOGOUT, "Logout"),
+    ]
+
+    event      = models.CharField(max_length=20, choices=EVENT_CHOICES)
+    success    = models.BooleanField()
+    user       = models.ForeignKey(
+        CustomUser, null=True, blank=True, related_name="+",
+        on_delete=models.DO_NOTHING, db_constraint=False, db_index=False,
+    )
+    identifier = models.CharField(max_length=255, blank=True)  # login name as submitted
+    ip         = models.GenericIPAddressField(null=True, blank=True)
+    user_agent = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField()  # when it happened, not when it was flushed
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "-created_at"], name="authevent_user_created_idx"),
+            models.Index(fields=["ip", "-created_at"], name="authevent_ip_created_idx"),
+            models.Index(fields=["created_at"], name="authevent_created_at_idx"),  # retention
+        ]
+
+    def __str__(self):
+        outcome = "ok" if self.success else "failed"
+        return f"{self.event} {outcome} ({self.identifier or self.user_id})"
@@ -1,7 +1,27 @@
 # accounts/serializers.py
 from rest_framework import serializers
 from django.contrib.auth import authenticate
-from .models import CustomUser
+from main.pincodes import get_index, is_valid_format
+from .models import AuthEvent, CustomUser
+
+
+class PinCodeValidationMixin:
+    """
+    Validates `pin_code` against the PIN-code index.
+
+    - Must be 6 digits not starting with 0.
+    - Must exist in the serviceability dataset when the index is available.
+    """
+
+    def validate_pin_code(self, value):
+        if not value:
+            return value
+        if not is_valid_format(value):
+            raise serializers.ValidationError("Enter a valid 6-digit PIN code.")
+        index = get_index()
+        if index is not None and value not in index:
+            raise serializers.ValidationError("Unknown PIN code.")
+        return value
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -25,12 +45,13 @@ class UserSerializer(serializers.ModelSerializer):
         }
 
 
-class RegisterSerializer(serializers.ModelSerializer):
+class RegisterSerializer(PinCodeValidationMixin, serializers.ModelSerializer):
     """
     User Registration Serializer
 
     - Validates and creates new users.
     - Requires a minimum 6-character password.
+    - Validates the PIN code against the serviceability index.
     - Exposes only safe fields for registration (no admin flags).
     """
     password = serializers.CharField(write_only=True, min_length=6)
@@ -89,12 +110,13 @@ class LoginSerializer(serializers.Serializer):
         return data
 
 
-class ProfileUpdateSerializer(serializers.ModelSerializer):
+class ProfileUpdateSerializer(PinCodeValidationMixin, serializers.ModelSerializer):
     """
     Profile Update Serializer
 
     - Allows editing personal details of a user.
     - Username is read-only (cannot be changed after registration).
+    - Validates the PIN code against the serviceability index.
     """
     username = serializers.CharField(read_only=True)
 
@@ -115,3 +137,33 @@ class ProfileUpdateSerializer(serializers.ModelSerializer):
             setattr(instance, attr, value)
         instance.save()
         return instance
+
+
+class AuthEventSerializer(serializers.ModelSerializer):
+    """
+    Authentication audit event (read-only)
+    """
+
+    class Meta:
+        model = AuthEvent
+        fields = ["id", "event", "success", "user", "identifier", "ip", "user_agent", "created_at"]
+        read_only_fields = fields
+
+
+class AuthEventQuerySerializer(serializers.Serializer):
+    """
+    Audit log query parameters
+
+    - At least one of `user` or `ip` is required (the indexed columns).
+    """
+    user = serializers.IntegerField(required=False, min_value=1)
+    ip = serializers.IPAddressField(required=False)
+    event = serializers.ChoiceField(choices=AuthEvent.EVENT_CHOICES, required=False)
+    success = serializers.BooleanField(required=False, allow_null=True)  # absent -> None, not False
+    since = serializers.DateTimeField(required=False)
+    until = serializers.DateTimeField(required=False)
+
+    def validate(self, data):
+        if "user" not in data and "ip" not in data:
+            raise serializers.ValidationError("Filter by `user` or `ip`.")
+        return data
@@ -0,0 +1,43 @@
+import logging
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+
+from core.jobs import task
+from .models import CustomUser
+
+
+logger = logging.getLogger(__name__)
+
+
+@task(batch=True)
+def send_welcome_email(payloads):
+    """
+    Send welcome emails for a batch of new users over one mail connection.
+
+    Messages are sent one by one and the indexes of the payloads that failed
+    are returned, so a retry never re-sends an email that already went out.
+    """
+    users = CustomUser.objects.only("email", "first_name").in_bulk(
+        [payload["user_id"] for payload in payloads]
+    )
+
+    failed = []
+    with get_connection() as connection:
+        for index, payload in enumerate(payloads):
+            user = users.get(payload["user_id"])
+            if user is None:
+                continue  # deleted since signing up
+            message = EmailMessage(
+                subject="Welcome to DRF Commerce",
+                body=f"Hi {user.first_name or 'there'},\n\nThanks for creating an account with us.",
+                from_email=settings.DEFAULT_FROM_EMAIL,
+                to=[user.email],
+                connection=connection,
+            )
+            try:
+                message.send()
+            except Exception:
+                logger.exception("Welcome email to user %s failed", user.pk)
+                failed.append(index)
+    return failed
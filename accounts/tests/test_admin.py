@@ -0,0 +1,42 @@
+import pytest
+
+from accounts.admin import user_search_filter
+from accounts.models import CustomUser
+
+
+@pytest.fixture
+def users(db):
+    return [
+        CustomUser.objects.create_user(
+            email="john.doe@example.com", first_name="John", last_name="Doe", mobile_no="9876543210"
+        ),
+        CustomUser.objects.create_user(
+            email="jane.roe@example.com", first_name="Jane", last_name="Roe", mobile_no="9123456789"
+        ),
+    ]
+
+
+@pytest.mark.parametrize("term, lookups", [
+    ("John.Doe@example.com", {"email__iexact"}),
+    ("john.doe@", {"email__istartswith"}),
+    ("9876543210", {"mobile_no"}),
+    ("98765", {"mobile_no__startswith"}),
+    ("john doe", {"first_name__istartswith", "last_name__istartswith"}),
+    ("jo", {"username__istartswith", "first_name__istartswith", "last_name__istartswith"}),
+])
+def test_search_column_is_picked_from_input_shape(term, lookups):
+    assert {lookup for lookup, _ in user_search_filter(term).children} == lookups
+
+
+def test_changelist_search(admin_client, users):
+    response = admin_client.get("/admin/accounts/customuser/", {"q": "9123456789"})
+
+    assert response.status_code == 200
+    assert list(response.context["cl"].result_list) == [users[1]]
+
+
+def test_change_view_header_does_not_touch_model_meta(admin_client, users):
+    response = admin_client.get(f"/admin/accounts/customuser/{users[0].pk}/change/")
+
+    assert response.context["title"] == f"User: {users[0].username}"
+    assert CustomUser._meta.verbose_name == "custom user"
@@ -0,0 +1,113 @@
+import json
+import threading
+from datetime import timedelta
+
+import pytest
+from django.core.management import call_command
+from django.test import RequestFactory
+from django.utils import timezone
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts import audit
+from accounts.models import AuthEvent
+
+
+@pytest.fixture
+def user(django_user_model):
+    return django_user_model.objects.create_user(email="user@example.com", password="secret123")
+
+
+def events():
+    audit.flush()
+    return list(AuthEvent.objects.order_by("id").values_list("event", "success", "user_id", "identifier"))
+
+
+@pytest.mark.django_db
+def test_login_refresh_and_logout_are_audited(client, user):
+    client.post("/api/accounts/login/", {"email": user.email, "password": "wrong"},
+                content_type="application/json")
+    tokens = client.post("/api/accounts/token/", {"email": user.email, "password": "secret123"},
+                         content_type="application/json").json()
+    refreshed = client.post("/api/accounts/token/refresh/", {"refresh": tokens["refresh"]},
+                            content_type="application/json").json()
+    client.post("/api/accounts/logout/", {"refresh": refreshed["refresh"]},
+                content_type="application/json", HTTP_AUTHORIZATION=f"Bearer {refreshed['access']}")
+
+    assert AuthEvent.objects.count() == 0  # nothing is written on the request path
+    assert events() == [
+        (AuthEvent.LOGIN, False, None, user.email),
+        (AuthEvent.TOKEN_OBTAIN, True, user.pk, user.email),
+        (AuthEvent.TOKEN_REFRESH, True, user.pk, ""),
+        (AuthEvent.LOGOUT, True, user.pk, ""),
+    ]
+    assert AuthEvent.objects.filter(ip="127.0.0.1").count() == 4
+
+
+def test_full_buffer_drops_oldest_events():
+    written = []
+    buffer = audit.AuditBuffer(sink=type("Sink", (), {"write": lambda self, batch: written.extend(batch)})(),
+                               capacity=3, batch_size=2, background=False)
+    for i in range(5):
+        buffer.record({"n": i})
+
+    assert buffer.flush() == 3
+    assert [event["n"] for event in written] == [2, 3, 4]
+    assert buffer.stats() == {"recorded": 5, "written": 3, "dropped": 2, "pending": 0, "capacity": 3}
+
+
+def test_background_flusher_writes_batches(tmp_path):
+    sink = audit.JSONLSink(tmp_path)
+    flushed = threading.Event()
+    write = sink.write
+    sink.write = lambda batch: (write(batch), flushed.set())
+
+    buffer = audit.AuditBuffer(sink, batch_size=1, flush_interval=60)
+    buffer.record({"event": "login", "success": True, "created_at": timezone.now()})
+
+    assert flushed.wait(5)
+    lines = (tmp_path / f"auth-{timezone.now().date().isoformat()}.jsonl").read_text().splitlines()
+    assert json.loads(lines[0])["event"] == "login"
+
+
+def test_process_hooks_follow_the_current_buffer(monkeypatch):
+    monkeypatch.setattr(audit.atexit, "register", lambda func: pytest.fail("hook registered per buffer"))
+    buffer = audit.get_buffer()
+    written = []
+    buffer.sink = type("Sink", (), {"write": lambda self, batch: written.extend(batch)})()
+    buffer.record({"n": 1})
+    buffer.background = True  # flushed at exit like a background buffer
+    wakeup = buffer.wakeup
+
+    audit._flush_at_exit()
+    audit._after_fork_in_child()
+
+    assert written == [{"n": 1}]
+    assert buffer.wakeup is not wakeup and buffer.thread is None
+
+
+@pytest.mark.django_db
+def test_query_api_filters_by_user_or_ip(client, user):
+    request = RequestFactory().post("/", REMOTE_ADDR="10.0.0.1")
+    audit.record_event(request, AuthEvent.LOGIN, success=True, user=user, identifier=user.email)
+    audit.record_event(request, AuthEvent.LOGIN, success=False, identifier="attacker@example.com")
+    audit.flush()
+
+    admin = type(user).objects.create_user(email="admin@example.com", password="secret123", is_staff=True)
+    client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {RefreshToken.for_user(admin).access_token}"
+
+    by_ip = client.get("/api/accounts/audit/events/?ip=10.0.0.1&success=false").json()
+    assert [row["identifier"] for row in by_ip["results"]] == ["attacker@example.com"]
+    by_user = client.get(f"/api/accounts/audit/events/?user={user.pk}").json()
+    assert [row["success"] for row in by_user["results"]] == [True]
+    assert client.get("/api/accounts/audit/events/").status_code == 400
+
+
+@pytest.mark.django_db
+def test_purge_removes_old_events():
+    now = timezone.now()
+    AuthEvent.objects.create(event=AuthEvent.LOGIN, success=True, created_at=now - timedelta(days=100))
+    AuthEvent.objects.create(event=AuthEvent.LOGIN, success=True, created_at=now)
+
+    call_command("purge_auth_events", "--days", "90")
+
+    assert AuthEvent.objects.count() == 1
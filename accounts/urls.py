@@ -1,6 +1,14 @@
 from django.urls import path
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
-from .views import RegisterView, LoginView, LogoutView, ProfileView, UserListView
+from .views import (
+    RegisterView,
+    LoginView,
+    LogoutView,
+    ProfileView,
+    UserListView,
+    AuditedTokenObtainPairView,
+    AuditedTokenRefreshView,
+    AuthEventListView,
+)
 
 
 urlpatterns = [
@@ -14,7 +22,10 @@ urlpatterns = [
     # User management (optional, for admin dashboards or staff APIs)
     path("accounts/users/", UserListView.as_view(), name="users"),
 
-    # JWT token endpoints (standard DRF SimpleJWT)
-    path("token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
-    path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
+    # JWT token endpoints (standard DRF SimpleJWT, audited)
+    path("token/", AuditedTokenObtainPairView.as_view(), name="token_obtain_pair"),
+    path("token/refresh/", AuditedTokenRefreshView.as_view(), name="token_refresh"),
+
+    # Authentication audit log (admins only)
+    path("audit/events/", AuthEventListView.as_view(), name="audit_events"),
 ]
@@ -1,20 +1,26 @@
+from django.conf import settings
 from rest_framework import generics, status
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import CursorPagination
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny, IsAuthenticated, IsAdminUser
 from rest_framework.views import APIView
-from django.contrib.auth import login, logout
-from rest_framework.authtoken.models import Token
-from rest_framework_simplejwt.tokens import RefreshToken
-from django.views.decorators.csrf import csrf_exempt
-from django.utils.decorators import method_decorator
-from rest_framework_simplejwt.exceptions import TokenError, InvalidToken
-from .models import CustomUser
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+from core.caching import cached_response
+from core.jobs import enqueue_on_commit
+from . import audit
+from .models import AuthEvent, CustomUser
 from .serializers import (
     UserSerializer,
     RegisterSerializer,
     LoginSerializer,
     ProfileUpdateSerializer,
+    AuthEventSerializer,
+    AuthEventQuerySerializer,
 )
+from .tasks import send_welcome_email
 
 
 class RegisterView(generics.CreateAPIView):
@@ -24,10 +30,16 @@ class RegisterView(generics.CreateAPIView):
     - Allows anyone to register a new user account.
     - Uses the `RegisterSerializer` to validate input and create the user.
     - Does not require authentication (open endpoint).
+    - The welcome email is queued as a background job (sent by `run_jobs`).
     """
     serializer_class = RegisterSerializer
     permission_classes = [AllowAny]
 
+    def perform_create(self, serializer):
+        user = serializer.save()
+        # Queue after commit so the request never waits on SMTP
+        enqueue_on_commit(send_welcome_email, {"user_id": user.pk})
+
 
 class LoginView(APIView):
     """
@@ -36,14 +48,18 @@ class LoginView(APIView):
     - Accepts email/username and password.
     - Returns an access token (short-lived) and a refresh token (long-lived).
     - Refresh token rotates on every login for better security.
+    - Successes and failures go to the authentication audit log.
     """
     permission_classes = [AllowAny]
 
     def post(self, request, *args, **kwargs):
         # Validate login credentials with the serializer
         serializer = LoginSerializer(data=request.data, context={"request": request})
-        serializer.is_valid(raise_exception=True)
+        if not serializer.is_valid():
+            audit.record_event(request, AuthEvent.LOGIN, success=False)
+            raise ValidationError(serializer.errors)
         user = serializer.validated_data["user"]
+        audit.record_event(request, AuthEvent.LOGIN, success=True, user=user)
 
         # Generate JWT tokens
         refresh = RefreshToken.for_user(user)
@@ -66,6 +82,7 @@ class LogoutView(APIView):
     - Requires authentication.
     - Accepts a refresh token (via body or query param).
     - Blacklists the refresh token so it cannot be reused.
+    - Recorded in the authentication audit log.
     """
     permission_classes = [IsAuthenticated]
 
@@ -78,22 +95,26 @@ class LogoutView(APIView):
     def _logout(self, request):
         refresh_token = request.data.get("refresh") or request.query_params.get("refresh")
         if not refresh_token:
+            audit.record_event(request, AuthEvent.LOGOUT, success=False, user=request.user, identifier="")
             return Response({"error": "Refresh token required"}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
             token = RefreshToken(refresh_token)
             token.blacklist()  # Add token to blacklist
-            return Response({"message": "Logout successful"}, status=status.HTTP_200_OK)
         except Exception:
+            audit.record_event(request, AuthEvent.LOGOUT, success=False, user=request.user, identifier="")
             return Response({"error": "Invalid or expired refresh token"}, status=status.HTTP_400_BAD_REQUEST)
 
+        audit.record_event(request, AuthEvent.LOGOUT, success=True, user=request.user, identifier="")
+        return Response({"message": "Logout successful"}, status=status.HTTP_200_OK)
+
 
 class ProfileView(generics.RetrieveUpdateAPIView):
     """
     User Profile API
 
     - Requires authentication.
-    - GET: Retrieve the full profile of the logged-in user.
+    - GET: Retrieve the full profile of the logged-in user (cached, tagged `user:<id>`).
     - PUT/PATCH: Update profile details.
     """
     serializer_class = ProfileUpdateSerializer
@@ -103,6 +124,10 @@ class ProfileView(generics.RetrieveUpdateAPIView):
         # Return the current authenticated user
         return self.request.user
 
+    @cached_response(
+        key=lambda view, request, *args, **kwargs: f"profile:{request.user.pk}",
+        tags=lambda view, request, *args, **kwargs: [f"user:{request.user.pk}"],
+    )
     def get(self, request, *args, **kwargs):
         # Override GET to return full user data (not just limited fields)
         serializer = UserSerializer(request.user)
@@ -116,6 +141,86 @@ class UserListView(generics.ListAPIView):
     - Only accessible by admins/staff.
     - Returns a list of all registered users.
     """
-    queryset = CustomUser.objects.all()
+    # Prefetch the M2M fields serialized by UserSerializer (avoids 2 queries per user)
+    queryset = CustomUser.objects.prefetch_related("groups", "user_permissions")
     serializer_class = UserSerializer
     permission_classes = [IsAdminUser]
+
+
+class AuditedTokenViewMixin:
+    """Records the outcome of a SimpleJWT token view in the authentication audit log."""
+    audit_event = None
+
+    def post(self, request, *args, **kwargs):
+        try:
+            response = super().post(request, *args, **kwargs)
+        except Exception:
+            audit.record_event(request, self.audit_event, success=False)
+            raise
+
+        # The user id is read from the issued access token: no extra query
+        user_id = AccessToken(response.data["access"]).get(jwt_settings.USER_ID_CLAIM)
+        audit.record_event(request, self.audit_event, success=True, user_id=user_id)
+        return response
+
+
+class AuditedTokenObtainPairView(AuditedTokenViewMixin, TokenObtainPairView):
+    """
+    JWT Token Obtain API
+
+    - SimpleJWT `TokenObtainPairView`, audited.
+    """
+    audit_event = AuthEvent.TOKEN_OBTAIN
+
+
+class AuditedTokenRefreshView(AuditedTokenViewMixin, TokenRefreshView):
+    """
+    JWT Token Refresh API
+
+    - SimpleJWT `TokenRefreshView`, audited.
+    """
+    audit_event = AuthEvent.TOKEN_REFRESH
+
+
+class AuthEventPagination(CursorPagination):
+    ordering = "-created_at"
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+
+class AuthEventListView(generics.ListAPIView):
+    """
+    Authentication Audit Log API
+
+    - Only accessible by admins/staff.
+    - Filter by `user` (id) and/or `ip` (one is required, so every query uses
+      an index), plus optional `event`, `success`, `since` and `until`.
+    - Newest first, paginated with `?cursor=` links.
+    - Only available with the "database" sink (`AUDIT_LOG_SINK`).
+    """
+    serializer_class = AuthEventSerializer
+    permission_classes = [IsAdminUser]
+    pagination_class = AuthEventPagination
+
+    def list(self, request, *args, **kwargs):
+        if getattr(settings, "AUDIT_LOG_SINK", "database") != "database":
+            return Response(
+                {"error": "Audit events are not stored in the database"},
+                status=status.HTTP_501_NOT_IMPLEMENTED,
+            )
+        return super().list(request, *args, **kwargs)
+
+    def get_queryset(self):
+        query = AuthEventQuerySerializer(data=self.request.query_params)
+        query.is_valid(raise_exception=True)
+        filters = {
+            field: value for field, value in query.validated_data.items()
+            if field in ("user", "ip", "event", "success") and value is not None
+        }
+        queryset = AuthEvent.objects.filter(**filters)
+        if "since" in query.validated_data:
+            queryset = queryset.filter(created_at__gte=query.validated_data["since"])
+        if "until" in query.validated_data:
+            queryset = queryset.filter(created_at__lt=query.validated_data["until"])
+        return queryset
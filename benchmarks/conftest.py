@@ -0,0 +1,150 @@
+"""
+Performance regression suite for the API.
+
+Every benchmark asserts a query-count budget (and, where relevant, a password
+hash budget) and records its latency. Latency only fails the run when a
+baseline is supplied.
+
+    # default: 1k seeded users, budgets only
+    python -m pytest benchmarks
+
+    # record a baseline on this machine, then compare against it later
+    python -m pytest benchmarks --bench-rows=100000 --bench-save=bench.json
+    python -m pytest benchmarks --bench-rows=100000 --bench-baseline=bench.json
+
+The seeded dataset uses a fast password hasher, so latency reflects the rest of
+the stack. The number of hashes per request is budgeted separately.
+"""
+import json
+import statistics
+import time
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from django.contrib.auth.hashers import MD5PasswordHasher, make_password
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+
+from accounts.models import CustomUser
+from core.stats import percentile
+
+
+BENCH_EMAIL_DOMAIN = "bench.example.com"
+BENCH_PASSWORD = "bench-password"
+FAST_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+results = {}
+
+
+def pytest_sessionfinish(session):
+    path = session.config.getoption("--bench-save", default=None)
+    if not path or not results:
+        return
+    path = Path(path)
+    saved = json.loads(path.read_text()) if path.exists() else {}
+    for rows, entries in results.items():
+        saved.setdefault(rows, {}).update(entries)
+    path.write_text(json.dumps(saved, indent=2, sort_keys=True))
+
+
+# -------------------------------------------------------------------
+# Dataset
+# -------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def seeded_users(request, django_db_blocker):
+    """
+    Seed `--bench-rows` users (committed, shared by the module) and remove them afterwards.
+
+    Returns the user the benchmarks log in as.
+    """
+    rows = request.config.getoption("--bench-rows")
+    with override_settings(PASSWORD_HASHERS=FAST_HASHERS), django_db_blocker.unblock():
+        password = make_password(BENCH_PASSWORD)
+        batch_size = 10_000
+        for start in range(0, rows, batch_size):
+            CustomUser.objects.bulk_create([
+                CustomUser(
+                    email=f"user{i}@{BENCH_EMAIL_DOMAIN}",
+                    username=f"bench_{i}",
+                    first_name=f"User{i}",
+                    password=password,
+                )
+                for i in range(start, min(start + batch_size, rows))
+            ])
+        yield CustomUser.objects.get(email=f"user0@{BENCH_EMAIL_DOMAIN}")
+        CustomUser.objects.filter(email__endswith=f"@{BENCH_EMAIL_DOMAIN}").delete()
+
+
+@pytest.fixture
+def bench_password():
+    """Password of every seeded user."""
+    return BENCH_PASSWORD
+
+
+# -------------------------------------------------------------------
+# Measurement
+# -------------------------------------------------------------------
+
+@pytest.fixture
+def bench(request, db, seeded_users, django_capture_on_commit_callbacks):
+    """
+    Run `call(arg)` once untimed, then `--bench-iterations` timed times.
+
+    - `setup(i)` (optional) prepares the argument outside the timed section,
+      e.g. a fresh refresh token for each logout.
+    - Every call must return `status`; the measured call must stay within
+      `queries` SQL queries and `hashes` password hash computations.
+    """
+    config = request.config
+    rows = str(config.getoption("--bench-rows"))
+    iterations = config.getoption("--bench-iterations")
+    baseline_path = config.getoption("--bench-baseline")
+    baseline = json.loads(Path(baseline_path).read_text()).get(rows, {}) if baseline_path else {}
+    tolerance = config.getoption("--bench-tolerance")
+
+    def run(name, call, queries, status=200, hashes=None, setup=lambda i: None):
+        encode = MD5PasswordHasher.encode
+        with override_settings(PASSWORD_HASHERS=FAST_HASHERS), \
+                mock.patch.object(MD5PasswordHasher, "encode", autospec=True, side_effect=encode) as hashed:
+            # Untimed call: budgets (includes on-commit work such as queued jobs)
+            arg = setup(0)
+            with CaptureQueriesContext(connection) as captured, \
+                    django_capture_on_commit_callbacks(execute=True):
+                response = call(arg)
+            assert response.status_code == status, response.content
+            hash_count = hashed.call_count
+            # Snapshot now: every request resets the connection's query log
+            queries_run = captured.captured_queries
+
+            timings = []
+            for i in range(1, iterations + 1):
+                arg = setup(i)
+                started = time.perf_counter()
+                response = call(arg)
+                timings.append((time.perf_counter() - started) * 1000)
+                assert response.status_code == status, response.content
+
+        entry = {
+            "median_ms": round(statistics.median(timings), 3),
+            "p95_ms": round(percentile(sorted(timings), 95), 3),
+            "queries": len(queries_run),
+            "hashes": hash_count,
+        }
+        results.setdefault(rows, {})[name] = entry
+
+        sql = "\n".join(query["sql"] for query in queries_run)
+        assert len(queries_run) <= queries, f"{name}: {len(queries_run)} queries (budget {queries}):\n{sql}"
+        if hashes is not None:
+            assert hash_count <= hashes, f"{name}: {hash_count} password hashes (budget {hashes})"
+        if name in baseline:
+            allowed = baseline[name]["median_ms"] * tolerance + 1.0  # +1ms absorbs timer noise
+            assert entry["median_ms"] <= allowed, (
+                f"{name}: median {entry['median_ms']}ms regressed (baseline "
+                f"{baseline[name]['median_ms']}ms, allowed {allowed:.3f}ms)"
+            )
+        return entry
+
+    return run
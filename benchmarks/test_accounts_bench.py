@@ -0,0 +1,107 @@
+"""
+Accounts API benchmarks: budgets are upper bounds, not exact counts.
+
+The budgets must not grow with `--bench-rows`; a query count that depends on
+the dataset size is an N+1.
+"""
+import pytest
+from rest_framework_simplejwt.tokens import RefreshToken
+
+
+@pytest.fixture
+def user(seeded_users):
+    return seeded_users
+
+
+@pytest.fixture
+def auth_client(client, user):
+    client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {RefreshToken.for_user(user).access_token}"
+    return client
+
+
+@pytest.fixture
+def admin_auth_client(client, user):
+    user.is_staff = True
+    user.save(update_fields=["is_staff"])
+    client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {RefreshToken.for_user(user).access_token}"
+    return client
+
+
+def test_register(bench, client):
+    # username uniqueness check, email uniqueness check, INSERT user, INSERT welcome-email job
+    bench(
+        "register",
+        lambda i: client.post(
+            "/api/accounts/register/",
+            {"email": f"new{i}@example.com", "first_name": "New", "password": "secret123"},
+            content_type="application/json",
+        ),
+        setup=lambda i: i,
+        queries=4,
+        hashes=1,
+        status=201,
+    )
+
+
+def test_login(bench, client, user, bench_password):
+    # user lookup, INSERT outstanding refresh token, user's groups + permissions (UserSerializer)
+    bench(
+        "login",
+        lambda _: client.post(
+            "/api/accounts/login/",
+            {"email": user.email, "password": bench_password},
+            content_type="application/json",
+        ),
+        queries=4,
+        hashes=1,
+    )
+
+
+def test_token_refresh(bench, client, user):
+    # SimpleJWT: blacklist check, user check, blacklist the old token
+    # (get_or_create + savepoint), outstand the new one (get_or_create + savepoint)
+    bench(
+        "token_refresh",
+        lambda refresh: client.post(
+            "/api/accounts/token/refresh/", {"refresh": refresh}, content_type="application/json"
+        ),
+        setup=lambda i: str(RefreshToken.for_user(user)),
+        queries=13,
+        hashes=0,
+    )
+
+
+def test_logout(bench, auth_client, user):
+    # JWT user load, blacklist check, blacklist the token (get_or_create + savepoint)
+    bench(
+        "logout",
+        lambda refresh: auth_client.post(
+            "/api/accounts/logout/", {"refresh": refresh}, content_type="application/json"
+        ),
+        setup=lambda i: str(RefreshToken.for_user(user)),
+        queries=8,
+        hashes=0,
+    )
+
+
+def test_profile_get(bench, auth_client):
+    # JWT user load, user's groups + permissions (UserSerializer)
+    bench("profile_get", lambda _: auth_client.get("/api/accounts/profile/"), queries=3, hashes=0)
+
+
+def test_profile_patch(bench, auth_client):
+    # JWT user load, UPDATE user
+    bench(
+        "profile_patch",
+        lambda i: auth_client.patch(
+            "/api/accounts/profile/", {"last_name": f"Name{i}"}, content_type="application/json"
+        ),
+        setup=lambda i: i,
+        queries=2,
+        hashes=0,
+    )
+
+
+def test_user_list(bench, admin_auth_client):
+    # JWT user load, users, prefetched groups, prefetched permissions
+    bench("user_list", lambda _: admin_auth_client.get("/api/accounts/users/"), queries=4, hashes=0)
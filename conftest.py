@@ -0,0 +1,46 @@
+# Command-line options must be registered by a root-level conftest so they are
+# accepted however the suite is invoked (benchmarks/conftest.py uses them).
+import pytest
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmarks")
+    group.addoption("--bench-rows", type=int, default=1000, choices=[1000, 100_000, 1_000_000],
+                    help="Number of users seeded before the benchmarks run.")
+    group.addoption("--bench-iterations", type=int, default=10,
+                    help="Timed iterations per endpoint.")
+    group.addoption("--bench-baseline", default=None,
+                    help="JSON file with recorded latencies; slower results fail.")
+    group.addoption("--bench-tolerance", type=float, default=1.5,
+                    help="Allowed slowdown factor against the baseline.")
+    group.addoption("--bench-save", default=None,
+                    help="Write (merge) this run's latencies into a JSON file.")
+
+
+@pytest.fixture(scope="session")
+def django_db_modify_db_settings(django_db_modify_db_settings_parallel_suffix, tmp_path_factory):
+    """
+    Use a file-backed SQLite test database.
+
+    The default in-memory database shares one cache between connections and
+    fails concurrent writers at once with "database table is locked"; a file
+    database makes them wait (IMMEDIATE transactions + busy timeout), so tests
+    can drive real concurrency (e.g. the loadtest command).
+    """
+    from django.conf import settings
+
+    database = settings.DATABASES["default"]
+    if database["ENGINE"] == "django.db.backends.sqlite3":
+        database.setdefault("TEST", {})["NAME"] = str(tmp_path_factory.mktemp("db") / "test.sqlite3")
+        database.setdefault("OPTIONS", {}).update({"timeout": 20, "transaction_mode": "IMMEDIATE"})
+
+
+@pytest.fixture(autouse=True)
+def buffered_audit_log(settings):
+    """Keep auth audit events in memory; tests that check them call `audit.flush()`."""
+    from accounts import audit
+
+    settings.AUDIT_BACKGROUND_FLUSH = False
+    audit.reset_buffer(flush=False)
+    yield
+    audit.reset_buffer(flush=False)
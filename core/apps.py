@@ -0,0 +1,11 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "core"
+
+    def ready(self):
+        # Register @task functions declared in each app's tasks.py
+        from django.utils.module_loading import autodiscover_modules
+        autodiscover_modules("tasks")
@@ -0,0 +1,324 @@
+"""
+Two-tier cache with tag invalidation.
+
+- Tier 1: a small per-process LRU (bounded size, short TTL) for hot keys.
+- Tier 2: the shared Django cache backend (`CACHES[TWO_TIER_CACHE_ALIAS]`).
+
+Every entry carries tags such as `user:<id>`, `product:<id>` or
+`category-tree`. Invalidating a tag replaces its version token in the shared
+backend, which makes every tier-2 entry stored under the old token stale, and
+drops matching tier-1 entries in this process. Other processes notice within
+`TWO_TIER_CACHE_LOCAL_TIMEOUT` seconds, when their tier-1 copy expires.
+
+    from core.caching import cache, cached_response, invalidate_on_change
+
+    data = cache.get_or_set("category-tree", build_tree, tags=["category-tree"])
+    invalidate_on_change(Category, lambda category: ["category-tree"])
+"""
+import threading
+import time
+import uuid
+from collections import Counter, OrderedDict
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import connection, transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from rest_framework.response import Response
+
+
+MISSING = object()
+
+
+class TwoTierCache:
+    lock_stripes = 64
+    poll_interval = 0.02
+
+    def __init__(self, alias=None, local_max_entries=None, local_timeout=None, lock_timeout=10):
+        self.alias = alias or getattr(settings, "TWO_TIER_CACHE_ALIAS", "default")
+        self.local_max_entries = local_max_entries or getattr(settings, "TWO_TIER_CACHE_LOCAL_MAX_ENTRIES", 1024)
+        self.local_timeout = local_timeout or getattr(settings, "TWO_TIER_CACHE_LOCAL_TIMEOUT", 5)
+        self.lock_timeout = lock_timeout
+
+        self.local = OrderedDict()  # key -> (expires_at, value, tags)
+        self.local_tags = {}        # tag -> set of local keys
+        self.lock = threading.Lock()
+        self.key_locks = [threading.Lock() for _ in range(self.lock_stripes)]
+        self.counters = Counter()
+        self.counter_lock = threading.Lock()
+
+    @property
+    def shared(self):
+        return caches[self.alias]
+
+    # ----------------------------------------------------------------
+    # Public API
+    # ----------------------------------------------------------------
+    def get(self, key, default=None):
+        value = self.get_local(key)
+        if value is not MISSING:
+            self.count("local_hits")
+            return value
+
+        entry = self.shared.get(key)
+        if entry is not None and self.tags_are_current(entry["tags"]):
+            self.count("shared_hits")
+            self.set_local(key, entry["value"], entry["tags"])
+            return entry["value"]
+
+        self.count("misses")
+        return default
+
+    def set(self, key, value, tags=(), timeout=None):
+        self.store(key, value, self.tag_tokens(tags), timeout)
+
+    def store(self, key, value, tag_tokens, timeout=None):
+        kwargs = {} if timeout is None else {"timeout": timeout}
+        self.shared.set(key, {"value": value, "tags": tag_tokens}, **kwargs)
+        self.set_local(key, value, tag_tokens)
+        self.count("sets")
+
+    def delete(self, key):
+        self.shared.delete(key)
+        with self.lock:
+            self.pop_local(key)
+
+    def get_or_set(self, key, compute, tags=(), timeout=None):
+        """
+        Return the cached value or compute it exactly once (single-flight).
+
+        Concurrent misses in this process wait on a striped lock; across
+        processes, the first worker takes a short lock in the shared backend and
+        the others poll for its result instead of recomputing.
+        """
+        value = self.get(key, MISSING)
+        if value is not MISSING:
+            return value
+
+        with self.key_locks[hash(key) % self.lock_stripes]:
+            value = self.get(key, MISSING)
+            if value is not MISSING:
+                return value
+
+            lock_key = f"lock:{key}"
+            acquired = self.shared.add(lock_key, 1, timeout=self.lock_timeout)
+            if not acquired:
+                deadline = time.monotonic() + self.lock_timeout
+                while time.monotonic() < deadline:
+                    time.sleep(self.poll_interval)
+                    value = self.get(key, MISSING)
+                    if value is not MISSING:
+                        return value
+                # The other worker is too slow (or died): compute ourselves
+
+            try:
+                self.count("computes")
+                # Tokens are read before computing: an invalidation that lands
+                # while we compute leaves this entry stale, never the reverse
+                tag_tokens = self.tag_tokens(tags)
+                value = compute()
+                self.store(key, value, tag_tokens, timeout)
+                return value
+            finally:
+                if acquired:
+                    self.shared.delete(lock_key)
+
+    def invalidate_tags(self, *tags):
+        """Make every entry carrying any of `tags` stale, in all processes."""
+        if not tags:
+            return
+        self.shared.set_many({self.tag_key(tag): uuid.uuid4().hex for tag in tags}, timeout=None)
+        with self.lock:
+            for tag in tags:
+                for key in self.local_tags.pop(tag, ()):
+                    self.pop_local(key)
+        self.count("invalidations", len(tags))
+
+    def clear_local(self):
+        with self.lock:
+            self.local.clear()
+            self.local_tags.clear()
+
+    def count(self, name, amount=1):
+        with self.counter_lock:
+            self.counters[name] += amount
+
+    def stats(self):
+        """Hit/miss counters for this process."""
+        with self.counter_lock:
+            stats = dict(self.counters)
+        lookups = sum(stats.get(name, 0) for name in ("local_hits", "shared_hits", "misses"))
+        hits = stats.get("local_hits", 0) + stats.get("shared_hits", 0)
+        stats["hit_rate"] = round(hits / lookups, 4) if lookups else 0.0
+        stats["local_entries"] = len(self.local)
+        return stats
+
+    # ----------------------------------------------------------------
+    # Tags
+    # ----------------------------------------------------------------
+    def tag_key(self, tag):
+        return f"tag:{tag}"
+
+    def tag_tokens(self, tags):
+        """Current version token of each tag, creating missing ones."""
+        if not tags:
+            return {}
+        keys = {self.tag_key(tag): tag for tag in tags}
+        tokens = self.shared.get_many(list(keys))
+        for key in keys:
+            if key not in tokens:
+                self.shared.add(key, uuid.uuid4().hex, timeout=None)
+                tokens[key] = self.shared.get(key)
+        return {keys[key]: token for key, token in tokens.items()}
+
+    def tags_are_current(self, tag_tokens):
+        if not tag_tokens:
+            return True
+        current = self.shared.get_many([self.tag_key(tag) for tag in tag_tokens])
+        return all(current.get(self.tag_key(tag)) == token for tag, token in tag_tokens.items())
+
+    # ----------------------------------------------------------------
+    # Tier 1 (per-process LRU)
+    # ----------------------------------------------------------------
+    def get_local(self, key):
+        with self.lock:
+            item = self.local.get(key)
+            if item is None:
+                return MISSING
+            expires_at, value, _ = item
+            if expires_at <= time.monotonic():
+                self.pop_local(key)
+                return MISSING
+            self.local.move_to_end(key)
+            return value
+
+    def set_local(self, key, value, tag_tokens):
+        with self.lock:
+            self.pop_local(key)
+            self.local[key] = (time.monotonic() + self.local_timeout, value, tag_tokens)
+            for tag in tag_tokens:
+                self.local_tags.setdefault(tag, set()).add(key)
+            while len(self.local) > self.local_max_entries:
+                self.pop_local(next(iter(self.local)))
+                self.count("evictions")
+
+    def pop_local(self, key):
+        """Remove a tier-1 entry; the caller holds `self.lock`."""
+        item = self.local.pop(key, None)
+        if item is None:
+            return
+        for tag in item[2]:
+            keys = self.local_tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.local_tags[tag]
+
+
+cache = TwoTierCache()
+
+
+# -------------------------------------------------------------------
+# Model signal invalidation
+# -------------------------------------------------------------------
+
+def invalidate_on_change(model, tags_for):
+    """
+    Invalidate `tags_for(instance)` whenever an instance is saved or deleted.
+
+    Tags are invalidated immediately and again after commit, so neither this
+    transaction nor a concurrent request can leave a stale entry behind.
+    Many-to-many changes need `invalidate_on_m2m_change` as well.
+    """
+    def handler(sender, instance, **kwargs):
+        _invalidate_now_and_on_commit(list(tags_for(instance)))
+
+    uid = f"two-tier-cache:{model._meta.label}"
+    post_save.connect(handler, sender=model, weak=False, dispatch_uid=uid)
+    post_delete.connect(handler, sender=model, weak=False, dispatch_uid=uid)
+
+
+def invalidate_on_m2m_change(descriptor, tags_for):
+    """
+    Invalidate `tags_for(instance)` when a many-to-many field changes, from
+    either side (`user.groups.add(...)` or `group.user_set.add(...)`).
+
+        invalidate_on_m2m_change(CustomUser.groups, lambda user: [f"user:{user.pk}"])
+
+    For changes made from the other side, `tags_for` receives unsaved
+    instances carrying only the primary key.
+    """
+    field = descriptor.field
+    model = field.model
+
+    def handler(sender, instance, action, reverse, pk_set, **kwargs):
+        if not reverse:
+            if action in ("post_add", "post_remove", "post_clear"):
+                _invalidate_now_and_on_commit(list(tags_for(instance)))
+            return
+
+        if action == "pre_clear":  # pk_set is not provided for clear()
+            pk_set = model._default_manager.filter(**{field.name: instance}).values_list("pk", flat=True)
+        elif action not in ("post_add", "post_remove"):
+            return
+        tags = [tag for pk in pk_set for tag in tags_for(model(pk=pk))]
+        _invalidate_now_and_on_commit(tags)
+
+    uid = f"two-tier-cache:{model._meta.label}.{field.name}"
+    m2m_changed.connect(handler, sender=descriptor.through, weak=False, dispatch_uid=uid)
+
+
+def _invalidate_now_and_on_commit(tags):
+    cache.invalidate_tags(*tags)
+    if connection.in_atomic_block:
+        transaction.on_commit(lambda: cache.invalidate_tags(*tags))
+
+
+# -------------------------------------------------------------------
+# View decorator
+# -------------------------------------------------------------------
+
+class _Uncacheable(Exception):
+    def __init__(self, response):
+        self.response = response
+
+
+def cached_response(key, tags=None, timeout=None):
+    """
+    Cache successful (200) responses of a DRF view method.
+
+    `key` and `tags` are callables receiving `(view, request, *args, **kwargs)`;
+    returning a `None` key bypasses the cache for that request.
+
+        @cached_response(
+            key=lambda view, request: f"profile:{request.user.pk}",
+            tags=lambda view, request: [f"user:{request.user.pk}"],
+        )
+        def get(self, request, *args, **kwargs): ...
+    """
+    def decorator(method):
+        @wraps(method)
+        def wrapper(view, request, *args, **kwargs):
+            cache_key = key(view, request, *args, **kwargs)
+            if cache_key is None:
+                return method(view, request, *args, **kwargs)
+
+            def compute():
+                response = method(view, request, *args, **kwargs)
+                if response.status_code != 200:
+                    raise _Uncacheable(response)
+                return response.data
+
+            try:
+                data = cache.get_or_set(
+                    f"view:{cache_key}",
+                    compute,
+                    tags=tags(view, request, *args, **kwargs) if tags else (),
+                    timeout=timeout,
+                )
+            except _Uncacheable as exc:
+                return exc.response
+            return Response(data)
+        return wrapper
+    return decorator
@@ -0,0 +1,201 @@
+"""
+Durable, database-backed background jobs.
+
+Usage:
+
+    from core.jobs import task, enqueue_on_commit
+
+    @task()
+    def resize_image(image_id):          # called as resize_image(**payload)
+        ...
+
+    @task(batch=True)
+    def send_welcome_email(payloads):    # called once with a list of payloads
+        ...                              # may return indexes of failed payloads
+
+    enqueue_on_commit(send_welcome_email, {"user_id": user.pk})
+
+Jobs are executed by `python manage.py run_jobs`.
+"""
+import logging
+import os
+import socket
+import traceback
+import uuid
+from datetime import timedelta
+from functools import partial
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+
+
+logger = logging.getLogger(__name__)
+
+# Task name -> callable, filled by the @task decorator (tasks.py modules are
+# autodiscovered by CoreConfig.ready)
+registry = {}
+
+
+# -------------------------------------------------------------------
+# Declaring & enqueueing
+# -------------------------------------------------------------------
+
+def task(name=None, batch=False, max_attempts=None):
+    """
+    Register a function as a background task.
+
+    - `batch=False`: the function is called once per job with the payload as kwargs.
+    - `batch=True`: similar jobs claimed together are passed as one list of payloads,
+      e.g. to send many emails over a single SMTP connection. The function may
+      return the indexes (into that list) of the payloads that failed; only
+      their jobs are retried. Raising
+      retries the whole batch, so only raise before any item took effect.
+    """
+    def decorator(func):
+        func.task_name = name or f"{func.__module__}.{func.__name__}"
+        func.batch = batch
+        func.max_attempts = max_attempts
+        registry[func.task_name] = func
+        return func
+    return decorator
+
+
+def enqueue(task, payload=None, delay=None, max_attempts=None):
+    """Insert a job row now (inside the caller's transaction, if any)."""
+    task_name = getattr(task, "task_name", task)
+    max_attempts = max_attempts or getattr(task, "max_attempts", None) or getattr(
+        settings, "JOB_MAX_ATTEMPTS", 5
+    )
+    return Job.objects.create(
+        task=task_name,
+        payload=payload or {},
+        max_attempts=max_attempts,
+        run_at=timezone.now() + (delay or timedelta()),
+    )
+
+
+def enqueue_on_commit(task, payload=None, **kwargs):
+    """
+    Enqueue once the current transaction commits.
+
+    Nothing is queued if the transaction rolls back, and views never wait on
+    the work itself, only on a single INSERT after commit.
+    """
+    transaction.on_commit(partial(enqueue, task, payload, **kwargs))
+
+
+# -------------------------------------------------------------------
+# Claiming & running (used by the worker)
+# -------------------------------------------------------------------
+
+def default_worker_id():
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+def requeue_stale_jobs():
+    """Put back jobs whose worker died while running them."""
+    timeout = getattr(settings, "JOB_VISIBILITY_TIMEOUT", 300)
+    return Job.objects.filter(
+        status=Job.RUNNING,
+        locked_at__lt=timezone.now() - timedelta(seconds=timeout),
+    ).update(status=Job.PENDING, locked_by="", locked_at=None)
+
+
+def claim_jobs(worker_id, limit):
+    """
+    Atomically claim up to `limit` due jobs for this worker.
+
+    - PostgreSQL: `SELECT ... FOR UPDATE SKIP LOCKED`, so concurrent workers
+      never block on, or double-claim, the same rows.
+    - SQLite (no row locks): pick candidates, then claim them with a
+      conditional UPDATE (`status = pending`), which SQLite serializes; only
+      rows this worker actually flipped are returned.
+    """
+    now = timezone.now()
+    due = Job.objects.filter(status=Job.PENDING, run_at__lte=now).order_by("run_at", "id")
+
+    def mark_running(ids):
+        Job.objects.filter(id__in=ids, status=Job.PENDING).update(
+            status=Job.RUNNING,
+            locked_by=worker_id,
+            locked_at=now,
+            attempts=F("attempts") + 1,
+        )
+
+    if connection.features.has_select_for_update_skip_locked:
+        with transaction.atomic():
+            ids = list(due.select_for_update(skip_locked=True).values_list("id", flat=True)[:limit])
+            mark_running(ids)
+    else:
+        # Each statement autocommits: holding SQLite's read lock across the
+        # UPDATE would make competing workers fail with "database is locked"
+        ids = list(due.values_list("id", flat=True)[:limit])
+        mark_running(ids)
+
+    return list(
+        Job.objects.filter(id__in=ids, status=Job.RUNNING, locked_by=worker_id, locked_at=now)
+        .order_by("run_at", "id")
+    )
+
+
+def run_jobs(jobs):
+    """Execute claimed jobs, grouping batchable tasks. Returns (succeeded, failed)."""
+    groups = {}
+    for job in jobs:
+        groups.setdefault(job.task, []).append(job)
+
+    succeeded = failed = 0
+    for task_name, group in groups.items():
+        func = registry.get(task_name)
+        if func is None:
+            mark_failed(group, f"Unknown task '{task_name}'", retry=False)
+            failed += len(group)
+            continue
+
+        calls = [group] if func.batch else [[job] for job in group]
+        for call in calls:
+            rejected = []
+            try:
+                if func.batch:
+                    failed_indexes = set(func([job.payload for job in call]) or ())
+                    rejected = [job for index, job in enumerate(call) if index in failed_indexes]
+                else:
+                    func(**call[0].payload)
+            except Exception:
+                logger.exception("Job %s failed", task_name)
+                mark_failed(call, traceback.format_exc())
+                failed += len(call)
+                continue
+
+            if rejected:
+                mark_failed(rejected, "Reported as failed by the batch task")
+                failed += len(rejected)
+            done = [job.id for job in call if job not in rejected]
+            Job.objects.filter(id__in=done).delete()
+            succeeded += len(done)
+    return succeeded, failed
+
+
+def retry_delay(attempts):
+    """Exponential backoff: base, 2*base, 4*base ... capped."""
+    base = getattr(settings, "JOB_RETRY_BASE_DELAY", 10)
+    cap = getattr(settings, "JOB_RETRY_MAX_DELAY", 3600)
+    return timedelta(seconds=min(base * 2 ** (attempts - 1), cap))
+
+
+def mark_failed(jobs, error, retry=True):
+    now = timezone.now()
+    for job in jobs:
+        job.last_error = error
+        job.locked_by = ""
+        job.locked_at = None
+        if retry and job.attempts < job.max_attempts:
+            job.status = Job.PENDING
+            job.run_at = now + retry_delay(job.attempts)
+        else:
+            job.status = Job.FAILED
+        job.save(update_fields=["status", "run_at", "last_error", "locked_by", "locked_at", "updated_at"])
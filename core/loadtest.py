@@ -0,0 +1,283 @@
+"""
+In-process load generator used by `manage.py loadtest`.
+
+Virtual clients call the WSGI or ASGI application object directly (the whole
+middleware + view + database stack runs, only the socket layer is skipped)
+and play the account scenario: signup -> login -> profile -> refresh -> logout.
+"""
+import asyncio
+import io
+import json
+import sys
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.handlers.asgi import ASGIHandler
+from django.core.handlers.wsgi import WSGIHandler
+
+from .stats import percentile
+
+
+ENDPOINTS = ("signup", "login", "profile", "refresh", "logout")
+PASSWORD = "loadtest-password"
+
+
+# -------------------------------------------------------------------
+# Statistics
+# -------------------------------------------------------------------
+
+class Recorder:
+    """Thread-safe collection of per-endpoint latencies and errors."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = {name: [] for name in ENDPOINTS}
+        self.errors = {name: 0 for name in ENDPOINTS}
+
+    def record(self, endpoint, elapsed_ms, ok):
+        with self.lock:
+            self.latencies[endpoint].append(elapsed_ms)
+            if not ok:
+                self.errors[endpoint] += 1
+
+    def report(self, wall_time):
+        endpoints = {}
+        total_requests = total_errors = 0
+        for name in ENDPOINTS:
+            values = sorted(self.latencies[name])
+            requests, errors = len(values), self.errors[name]
+            total_requests += requests
+            total_errors += errors
+            endpoints[name] = {
+                "requests": requests,
+                "errors": errors,
+                "error_rate": round(errors / requests, 4) if requests else 0.0,
+                "throughput_rps": round(requests / wall_time, 2) if wall_time else 0.0,
+                "p50_ms": _round(percentile(values, 50)),
+                "p95_ms": _round(percentile(values, 95)),
+                "p99_ms": _round(percentile(values, 99)),
+            }
+        return {
+            "wall_time_s": round(wall_time, 3),
+            "requests": total_requests,
+            "errors": total_errors,
+            "error_rate": round(total_errors / total_requests, 4) if total_requests else 0.0,
+            "throughput_rps": round(total_requests / wall_time, 2) if wall_time else 0.0,
+            "endpoints": endpoints,
+        }
+
+
+def _round(value):
+    return None if value is None else round(value, 2)
+
+
+# -------------------------------------------------------------------
+# Transports
+# -------------------------------------------------------------------
+
+def default_host():
+    """A host name the configured ALLOWED_HOSTS accepts."""
+    for host in settings.ALLOWED_HOSTS:
+        host = host.lstrip(".")
+        if host and host != "*":
+            return host
+    return "localhost"
+
+
+class WSGITransport:
+    def __init__(self):
+        self.application = WSGIHandler()
+        self.host = default_host()
+
+    def request(self, method, path, body=None, token=None):
+        content = json.dumps(body).encode() if body is not None else b""
+        environ = {
+            "REQUEST_METHOD": method, "PATH_INFO": path, "QUERY_STRING": "", "SCRIPT_NAME": "",
+            "SERVER_NAME": self.host, "SERVER_PORT": "443", "HTTP_HOST": self.host,
+            "SERVER_PROTOCOL": "HTTP/1.1", "REMOTE_ADDR": "127.0.0.1",
+            "CONTENT_TYPE": "application/json", "CONTENT_LENGTH": str(len(content)),
+            "wsgi.input": io.BytesIO(content), "wsgi.errors": sys.stderr, "wsgi.url_scheme": "https",
+            "wsgi.version": (1, 0), "wsgi.multithread": True, "wsgi.multiprocess": False,
+            "wsgi.run_once": False,
+        }
+        if token:
+            environ["HTTP_AUTHORIZATION"] = f"Bearer {token}"
+
+        status = []
+        result = self.application(environ, lambda line, headers, exc_info=None: status.append(line))
+        try:
+            payload = b"".join(result)
+        finally:
+            getattr(result, "close", lambda: None)()
+        return int(status[0].split()[0]), payload
+
+
+class ASGITransport:
+    def __init__(self):
+        self.application = ASGIHandler()
+        self.host = default_host()
+
+    async def request(self, method, path, body=None, token=None):
+        content = json.dumps(body).encode() if body is not None else b""
+        headers = [
+            (b"host", self.host.encode()),
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(content)).encode()),
+        ]
+        if token:
+            headers.append((b"authorization", f"Bearer {token}".encode()))
+        scope = {
+            "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+            "method": method, "scheme": "https", "path": path, "raw_path": path.encode(),
+            "query_string": b"", "root_path": "", "headers": headers,
+            "client": ("127.0.0.1", 50000), "server": (self.host, 443),
+        }
+        incoming = [{"type": "http.request", "body": content, "more_body": False}]
+        response = {"status": 0, "body": []}
+
+        async def receive():
+            if incoming:
+                return incoming.pop()
+            await asyncio.Event().wait()  # the client never disconnects early
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            elif message["type"] == "http.response.body":
+                response["body"].append(message.get("body", b""))
+
+        await self.application(scope, receive, send)
+        return response["status"], b"".join(response["body"])
+
+
+# -------------------------------------------------------------------
+# Scenario
+# -------------------------------------------------------------------
+
+STEPS = (
+    # endpoint, method, path, expected status
+    ("signup", "POST", "/api/accounts/register/", 201),
+    ("login", "POST", "/api/accounts/login/", 200),
+    ("profile", "GET", "/api/accounts/profile/", 200),
+    ("refresh", "POST", "/api/accounts/token/refresh/", 200),
+    ("logout", "POST", "/api/accounts/logout/", 200),
+)
+
+
+def step_request(endpoint, email, tokens):
+    """Body and bearer token for one scenario step."""
+    if endpoint == "signup":
+        return {"email": email, "first_name": "Load", "password": PASSWORD}, None
+    if endpoint == "login":
+        return {"email": email, "password": PASSWORD}, None
+    if endpoint == "profile":
+        return None, tokens.get("access")
+    if endpoint == "refresh":
+        return {"refresh": tokens.get("refresh")}, None
+    return {"refresh": tokens.get("refresh")}, tokens.get("access")
+
+
+def update_tokens(tokens, payload):
+    try:
+        data = json.loads(payload)
+    except ValueError:
+        return
+    for key in ("access", "refresh"):
+        if isinstance(data, dict) and key in data:
+            tokens[key] = data[key]
+
+
+class LoadTest:
+    """
+    Drive `clients` concurrent virtual users.
+
+    Each client repeats the scenario `iterations` times, or until `duration`
+    seconds have elapsed when a duration is given. A failed step aborts the rest
+    of that iteration. Users are created as `loadtest-<run id>-...@example.com`.
+    """
+
+    def __init__(self, mode="wsgi", clients=10, iterations=5, duration=None):
+        self.mode = mode
+        self.clients = clients
+        self.iterations = iterations
+        self.duration = duration
+        self.run_id = uuid.uuid4().hex[:8]
+        self.recorder = Recorder()
+
+    @property
+    def email_prefix(self):
+        return f"loadtest-{self.run_id}-"
+
+    def email(self, client, iteration):
+        return f"{self.email_prefix}{client}-{iteration}@example.com"
+
+    def keep_going(self, iteration, deadline):
+        if self.duration is not None:
+            return time.monotonic() < deadline
+        return iteration < self.iterations
+
+    def run(self):
+        started = time.monotonic()
+        deadline = started + (self.duration or 0)
+        if self.mode == "asgi":
+            asyncio.run(self.run_asgi(deadline))
+        else:
+            self.run_wsgi(deadline)
+        return self.recorder.report(time.monotonic() - started)
+
+    # WSGI: one thread per virtual client
+    def run_wsgi(self, deadline):
+        transport = WSGITransport()
+        with ThreadPoolExecutor(max_workers=self.clients) as pool:
+            futures = [pool.submit(self.wsgi_client, transport, client, deadline)
+                       for client in range(self.clients)]
+            for future in futures:
+                future.result()
+
+    def wsgi_client(self, transport, client, deadline):
+        iteration = 0
+        while self.keep_going(iteration, deadline):
+            tokens = {}
+            email = self.email(client, iteration)
+            for endpoint, method, path, expected in STEPS:
+                body, token = step_request(endpoint, email, tokens)
+                started = time.perf_counter()
+                try:
+                    status, payload = transport.request(method, path, body, token)
+                except Exception:
+                    status, payload = 0, b""
+                ok = status == expected
+                self.recorder.record(endpoint, (time.perf_counter() - started) * 1000, ok)
+                if not ok:
+                    break
+                update_tokens(tokens, payload)
+            iteration += 1
+
+    # ASGI: one task per virtual client on a single event loop
+    async def run_asgi(self, deadline):
+        transport = ASGITransport()
+        await asyncio.gather(*[
+            self.asgi_client(transport, client, deadline) for client in range(self.clients)
+        ])
+
+    async def asgi_client(self, transport, client, deadline):
+        iteration = 0
+        while self.keep_going(iteration, deadline):
+            tokens = {}
+            email = self.email(client, iteration)
+            for endpoint, method, path, expected in STEPS:
+                body, token = step_request(endpoint, email, tokens)
+                started = time.perf_counter()
+                try:
+                    status, payload = await transport.request(method, path, body, token)
+                except Exception:
+                    status, payload = 0, b""
+                ok = status == expected
+                self.recorder.record(endpoint, (time.perf_counter() - started) * 1000, ok)
+                if not ok:
+                    break
+                update_tokens(tokens, payload)
+            iteration += 1
@@ -0,0 +1,119 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+# Runs in a fresh interpreter so imports are genuinely cold. Prints one JSON
+# line: time to import the entry point (including warm-up, if enabled) and
+# latency of the first two requests served by the application callable.
+CHILD_SCRIPT = r"""
+import asyncio, io, json, sys, time
+
+entry, path = sys.argv[1], sys.argv[2]
+started = time.perf_counter()
+if entry == "asgi":
+    from drfcommerce.asgi import application
+else:
+    from drfcommerce.wsgi import application
+import_ms = (time.perf_counter() - started) * 1000
+
+
+def wsgi_request():
+    environ = {
+        "REQUEST_METHOD": "GET", "PATH_INFO": path, "QUERY_STRING": "",
+        "SERVER_NAME": "localhost", "SERVER_PORT": "80", "HTTP_HOST": "localhost",
+        "SERVER_PROTOCOL": "HTTP/1.1", "wsgi.input": io.BytesIO(), "wsgi.errors": sys.stderr,
+        "wsgi.url_scheme": "http", "wsgi.version": (1, 0), "wsgi.multithread": True,
+        "wsgi.multiprocess": True, "wsgi.run_once": False,
+    }
+    result = application(environ, lambda status, headers, exc_info=None: None)
+    b"".join(result)
+    getattr(result, "close", lambda: None)()
+
+
+def asgi_request():
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"",
+        "root_path": "", "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 50000), "server": ("localhost", 80),
+    }
+
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await asyncio.Event().wait()  # no disconnect while the response is produced
+
+    async def send(message):
+        pass
+
+    asyncio.run(application(scope, receive, send))
+
+
+request = asgi_request if entry == "asgi" else wsgi_request
+latencies = []
+for _ in range(2):
+    started = time.perf_counter()
+    request()
+    latencies.append((time.perf_counter() - started) * 1000)
+
+print(json.dumps({"import_ms": import_ms, "first_request_ms": latencies[0], "second_request_ms": latencies[1]}))
+"""
+
+METRICS = ("import_ms", "first_request_ms", "second_request_ms")
+
+
+class Command(BaseCommand):
+    help = "Measure worker cold start (import time and first-request latency) with and without warm-up."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--entry", choices=["wsgi", "asgi"], default="wsgi",
+                            help="Entry point module to load.")
+        parser.add_argument("--path", default="/api/accounts/profile/",
+                            help="Path requested by the simulated first requests.")
+        parser.add_argument("--runs", type=int, default=5,
+                            help="Fresh interpreters started per mode (medians are reported).")
+        parser.add_argument("--json", action="store_true",
+                            help="Print the results as JSON.")
+
+    def handle(self, *args, **options):
+        results = {}
+        for mode, enabled in (("cold", "False"), ("warm", "True")):
+            samples = [self.run_child(options["entry"], options["path"], enabled)
+                       for _ in range(options["runs"])]
+            results[mode] = {
+                metric: round(statistics.median(sample[metric] for sample in samples), 2)
+                for metric in METRICS
+            }
+
+        if options["json"]:
+            self.stdout.write(json.dumps(results, indent=2))
+            return
+
+        self.stdout.write(f"{'mode':<6}" + "".join(f"{metric:>20}" for metric in METRICS))
+        for mode, values in results.items():
+            self.stdout.write(f"{mode:<6}" + "".join(f"{values[metric]:>20.2f}" for metric in METRICS))
+
+    def run_child(self, entry, path, warmup_enabled):
+        env = {
+            **os.environ,
+            "DJANGO_SETTINGS_MODULE": os.environ.get("DJANGO_SETTINGS_MODULE", settings.SETTINGS_MODULE),
+            "WARMUP_ON_STARTUP": warmup_enabled,
+        }
+        completed = subprocess.run(
+            [sys.executable, "-c", CHILD_SCRIPT, entry, path],
+            cwd=settings.BASE_DIR.parent,
+            env=env,
+            capture_output=True,
+            text=True,
+        )
+        if completed.returncode != 0:
+            raise CommandError(f"Benchmark process failed:\n{completed.stderr}")
+        return json.loads(completed.stdout.strip().splitlines()[-1])
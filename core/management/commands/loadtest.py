@@ -0,0 +1,94 @@
+import json
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import OutstandingToken
+
+from accounts import audit
+from accounts.models import AuthEvent, CustomUser
+from core.loadtest import ENDPOINTS, LoadTest
+from core.models import Job
+
+
+class Command(BaseCommand):
+    help = (
+        "Run a concurrent signup -> login -> profile -> refresh -> logout load test "
+        "against the in-process WSGI or ASGI application."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--mode", choices=["wsgi", "asgi"], default="wsgi",
+                            help="Application entry point to drive.")
+        parser.add_argument("--clients", type=int, default=10,
+                            help="Number of concurrent virtual clients.")
+        parser.add_argument("--iterations", type=int, default=5,
+                            help="Scenario runs per client (ignored with --duration).")
+        parser.add_argument("--duration", type=float, default=None,
+                            help="Run for this many seconds instead of a fixed iteration count.")
+        parser.add_argument("--json", dest="json_path", default=None,
+                            help="Also write the report to this JSON file.")
+        parser.add_argument("--keep-data", action="store_true",
+                            help="Keep the users, tokens, jobs and audit events created by the run.")
+
+    def handle(self, *args, **options):
+        if options["clients"] < 1:
+            raise CommandError("--clients must be at least 1.")
+
+        load_test = LoadTest(
+            mode=options["mode"],
+            clients=options["clients"],
+            iterations=options["iterations"],
+            duration=options["duration"],
+        )
+        started_at = timezone.now()
+        try:
+            results = load_test.run()
+        finally:
+            if not options["keep_data"]:
+                self.cleanup(load_test.email_prefix)
+
+        report = {
+            "started_at": started_at.isoformat(),
+            "mode": options["mode"],
+            "clients": options["clients"],
+            "iterations": None if options["duration"] else options["iterations"],
+            "duration_s": options["duration"],
+            "database": connection.vendor,
+            **results,
+        }
+        self.print_report(report)
+
+        if options["json_path"]:
+            Path(options["json_path"]).write_text(json.dumps(report, indent=2))
+            self.stdout.write(self.style.SUCCESS(f"Report written to {options['json_path']}"))
+
+    def print_report(self, report):
+        self.stdout.write(
+            f"{report['mode'].upper()} | {report['clients']} clients | "
+            f"{report['requests']} requests in {report['wall_time_s']}s | "
+            f"{report['throughput_rps']} req/s | error rate {report['error_rate']:.2%}"
+        )
+        header = f"{'endpoint':<10}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        self.stdout.write(header)
+        for name in ENDPOINTS:
+            stats = report["endpoints"][name]
+            self.stdout.write(
+                f"{name:<10}{stats['requests']:>10}{stats['errors']:>8}{stats['throughput_rps']:>10}"
+                + "".join(
+                    f"{'-' if stats[key] is None else stats[key]:>10}"
+                    for key in ("p50_ms", "p95_ms", "p99_ms")
+                )
+            )
+
+    def cleanup(self, email_prefix):
+        """Remove everything the virtual users created."""
+        users = CustomUser.objects.filter(email__startswith=email_prefix)
+        user_ids = list(users.values_list("id", flat=True))
+        OutstandingToken.objects.filter(user_id__in=user_ids).delete()
+        Job.objects.filter(task="accounts.tasks.send_welcome_email", payload__user_id__in=user_ids).delete()
+        audit.flush()
+        AuthEvent.objects.filter(Q(user_id__in=user_ids) | Q(identifier__startswith=email_prefix)).delete()
+        users.delete()
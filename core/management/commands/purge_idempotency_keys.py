@@ -0,0 +1,12 @@
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from core.models import IdempotencyRecord
+
+
+class Command(BaseCommand):
+    help = "Delete expired Idempotency-Key records."
+
+    def handle(self, *args, **options):
+        deleted, _ = IdempotencyRecord.objects.filter(expires_at__lte=timezone.now()).delete()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} expired idempotency key(s)."))
@@ -0,0 +1,45 @@
+import signal
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from core.jobs import claim_jobs, default_worker_id, requeue_stale_jobs, run_jobs
+
+
+class Command(BaseCommand):
+    help = "Run the background job worker (emails and other slow side effects)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=50,
+                            help="Maximum number of jobs claimed per round.")
+        parser.add_argument("--sleep", type=float, default=1.0,
+                            help="Seconds to wait when the queue is empty.")
+        parser.add_argument("--once", action="store_true",
+                            help="Drain the currently due jobs and exit.")
+
+    def handle(self, *args, **options):
+        worker_id = default_worker_id()
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self.stop)
+        self.stdout.write(f"Job worker {worker_id} started.")
+
+        while not self.stopping:
+            close_old_connections()
+            requeue_stale_jobs()
+            jobs = claim_jobs(worker_id, options["batch_size"])
+
+            if jobs:
+                succeeded, failed = run_jobs(jobs)
+                self.stdout.write(f"Ran {len(jobs)} job(s): {succeeded} succeeded, {failed} failed.")
+                continue
+
+            if options["once"]:
+                break
+            time.sleep(options["sleep"])
+
+        self.stdout.write(self.style.SUCCESS(f"Job worker {worker_id} stopped."))
+
+    def stop(self, signum, frame):
+        # Finish the current round, then exit
+        self.stopping = True
@@ -0,0 +1,262 @@
+import asyncio
+import hashlib
+import logging
+import time
+from datetime import timedelta
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.http import HttpResponse, JsonResponse
+from django.utils import timezone
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+from .models import IdempotencyRecord
+
+
+logger = logging.getLogger(__name__)
+
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS", "TRACE")
+
+# Headers that belong to the original exchange and must not be replayed
+UNREPLAYABLE_HEADERS = {"content-length", "set-cookie"}
+
+
+class IdempotencyMiddleware:
+    """
+    Honour the `Idempotency-Key` header on unsafe requests.
+
+    - The first request for a (user, key) pair runs the view and stores its response.
+    - Retries with the same key and the same request replay the stored response
+      without executing the view again.
+    - Retries that arrive while the first request is still running wait for it
+      (up to `IDEMPOTENCY_WAIT_TIMEOUT` seconds) instead of racing it.
+    - Reusing a key for a different request body/path returns 422.
+    - Server errors (5xx) are not stored, so the client may retry them.
+    - Runs natively under both WSGI and ASGI; async waits use `asyncio.sleep`
+      and the poll interval backs off, so a waiting retry costs a few queries.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    header = "HTTP_IDEMPOTENCY_KEY"
+    poll_interval = 0.05     # first wait; doubled after every poll
+    max_poll_interval = 1.0
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.jwt_auth = JWTAuthentication()
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+
+        key = request.META.get(self.header)
+        if request.method in SAFE_METHODS or not key:
+            return self.get_response(request)
+        if len(key) > 255:
+            return self.key_too_long()
+
+        owner = self.get_owner(request)
+        fingerprint = self.get_fingerprint(request)
+        record, early_response = self.acquire(owner, key, fingerprint)
+        if early_response is not None:
+            return early_response
+
+        try:
+            response = self.get_response(request)
+        except Exception:
+            self.release(record)
+            raise
+
+        self.store(record, response)
+        return response
+
+    async def __acall__(self, request):
+        key = request.META.get(self.header)
+        if request.method in SAFE_METHODS or not key:
+            return await self.get_response(request)
+        if len(key) > 255:
+            return self.key_too_long()
+
+        # The session user is loaded lazily from the database
+        owner = await sync_to_async(self.get_owner)(request)
+        fingerprint = self.get_fingerprint(request)
+        record, early_response = await self.aacquire(owner, key, fingerprint)
+        if early_response is not None:
+            return early_response
+
+        try:
+            response = await self.get_response(request)
+        except Exception:
+            await sync_to_async(self.release)(record)
+            raise
+
+        await sync_to_async(self.store)(record, response)
+        return response
+
+    def key_too_long(self):
+        return JsonResponse({"error": "Idempotency-Key must be at most 255 characters"}, status=400)
+
+    # ----------------------------------------------------------------
+    # Request identity
+    # ----------------------------------------------------------------
+    def get_owner(self, request):
+        """
+        Identify who sent the request without loading the user row.
+
+        JWT requests are keyed by the `user_id` claim, session requests by the
+        session user, everything else shares the anonymous namespace (the
+        fingerprint still protects against mismatched reuse).
+        """
+        header = self.jwt_auth.get_header(request)
+        raw_token = self.jwt_auth.get_raw_token(header) if header else None
+        if raw_token is not None:
+            try:
+                token = self.jwt_auth.get_validated_token(raw_token)
+                return f"user:{token[jwt_settings.USER_ID_CLAIM]}"
+            except (InvalidToken, TokenError, KeyError):
+                return "anonymous"
+
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            return f"user:{user.pk}"
+        return "anonymous"
+
+    def get_fingerprint(self, request):
+        """Hash of everything that makes two requests 'the same request'."""
+        digest = hashlib.sha256()
+        for part in (request.method, request.path, request.META.get("QUERY_STRING", "")):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        digest.update(request.body)
+        return digest.hexdigest()
+
+    # ----------------------------------------------------------------
+    # Record lifecycle
+    # ----------------------------------------------------------------
+    def acquire(self, owner, key, fingerprint):
+        """
+        Claim the key for this request.
+
+        Returns `(record, None)` when the caller should run the view, or
+        `(None, response)` when a stored or error response must be returned.
+        """
+        deadline = time.monotonic() + getattr(settings, "IDEMPOTENCY_WAIT_TIMEOUT", 10)
+        delay = self.poll_interval
+        while True:
+            record, response = self.try_acquire(owner, key, fingerprint, deadline)
+            if record is not None or response is not None:
+                return record, response
+            time.sleep(delay)
+            delay = min(delay * 2, self.max_poll_interval)
+
+    async def aacquire(self, owner, key, fingerprint):
+        """`acquire` for ASGI: database work in a thread, waiting on the event loop."""
+        deadline = time.monotonic() + getattr(settings, "IDEMPOTENCY_WAIT_TIMEOUT", 10)
+        delay = self.poll_interval
+        while True:
+            record, response = await sync_to_async(self.try_acquire)(owner, key, fingerprint, deadline)
+            if record is not None or response is not None:
+                return record, response
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.max_poll_interval)
+
+    def try_acquire(self, owner, key, fingerprint, deadline):
+        """
+        One claim attempt: `(record, None)`, `(None, response)`, or
+        `(None, None)` when another request holds the key and the caller
+        should wait and try again.
+        """
+        in_flight_ttl = getattr(settings, "IDEMPOTENCY_IN_FLIGHT_TTL", timedelta(minutes=1))
+
+        while True:
+            now = timezone.now()
+            try:
+                with transaction.atomic():
+                    record = IdempotencyRecord.objects.create(
+                        owner=owner,
+                        key=key,
+                        fingerprint=fingerprint,
+                        expires_at=now + in_flight_ttl,
+                    )
+                return record, None
+            except IntegrityError:
+                pass
+
+            existing = IdempotencyRecord.objects.filter(owner=owner, key=key).first()
+            if existing is None:
+                # Deleted between our insert and our read (failed or expired); retry
+                continue
+
+            if existing.expires_at <= now:
+                # Expired key, or an in-flight request whose worker died
+                IdempotencyRecord.objects.filter(pk=existing.pk, status=existing.status).delete()
+                continue
+
+            if existing.fingerprint != fingerprint:
+                return None, JsonResponse(
+                    {"error": "Idempotency-Key was already used for a different request"},
+                    status=422,
+                )
+
+            if existing.status == IdempotencyRecord.COMPLETED:
+                return None, self.replay(existing)
+
+            if time.monotonic() >= deadline:
+                return None, JsonResponse(
+                    {"error": "A request with this Idempotency-Key is still being processed"},
+                    status=409,
+                )
+            return None, None
+
+    def store(self, record, response):
+        """
+        Save the response for replay, or release the key if it cannot be replayed.
+
+        Only our own in-progress claim is updated. If the claim was reaped
+        (this request outlived `IDEMPOTENCY_IN_FLIGHT_TTL`) the response is
+        still returned to the client, just not stored.
+        """
+        if response.streaming or response.status_code >= 500:
+            self.release(record)
+            return
+
+        ttl = getattr(settings, "IDEMPOTENCY_KEY_TTL", timedelta(hours=24))
+        stored = IdempotencyRecord.objects.filter(
+            pk=record.pk, status=IdempotencyRecord.IN_PROGRESS
+        ).update(
+            status=IdempotencyRecord.COMPLETED,
+            response_status=response.status_code,
+            response_headers={
+                name: value
+                for name, value in response.items()
+                if name.lower() not in UNREPLAYABLE_HEADERS
+            },
+            response_body=response.content,
+            expires_at=timezone.now() + ttl,
+        )
+        if not stored:
+            logger.warning(
+                "Idempotency-Key %r of %s expired while its request was running; response not stored",
+                record.key, record.owner,
+            )
+
+    def release(self, record):
+        """Give the key back, unless our claim was already reaped."""
+        IdempotencyRecord.objects.filter(pk=record.pk, status=IdempotencyRecord.IN_PROGRESS).delete()
+
+    def replay(self, record):
+        """Rebuild the stored response."""
+        response = HttpResponse(bytes(record.response_body), status=record.response_status)
+        for name, value in record.response_headers.items():
+            response[name] = value
+        response["Idempotent-Replayed"] = "true"
+        return response
@@ -0,0 +1,91 @@
+from django.db import models
+from django.utils import timezone
+
+
+# -------------------------------------------------------------------
+# Idempotency
+# -------------------------------------------------------------------
+
+class IdempotencyRecord(models.Model):
+    """
+    First response stored for an `Idempotency-Key` sent on an unsafe request.
+
+    A row is inserted (IN_PROGRESS) before the view runs, so the unique
+    constraint on (owner, key) doubles as a lock for concurrent duplicates.
+    Once the view returns, the response is saved and the row is COMPLETED.
+    """
+
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    STATUS_CHOICES = [
+        (IN_PROGRESS, "In progress"),
+        (COMPLETED, "Completed"),
+    ]
+
+    owner       = models.CharField(max_length=64)
+    key         = models.CharField(max_length=255)
+    fingerprint = models.CharField(max_length=64)
+    status      = models.CharField(max_length=16, choices=STATUS_CHOICES, default=IN_PROGRESS)
+
+    # Stored response
+    response_status  = models.PositiveSmallIntegerField(null=True, blank=True)
+    response_headers = models.JSONField(default=dict, blank=True)
+    response_body    = models.BinaryField(default=b"", blank=True)
+
+    # Tracking
+    created_at = models.DateTimeField(default=timezone.now)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["owner", "key"], name="idempotency_owner_key_uniq"),
+        ]
+
+    def __str__(self):
+        return f"{self.owner}:{self.key} ({self.status})"
+
+
+# -------------------------------------------------------------------
+# Background jobs
+# -------------------------------------------------------------------
+
+class Job(models.Model):
+    """
+    A unit of deferred work executed by `manage.py run_jobs`.
+
+    Successful jobs are deleted, so the table only holds pending, running
+    and permanently failed work.
+    """
+
+    PENDING = "pending"
+    RUNNING = "running"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (RUNNING, "Running"),
+        (FAILED, "Failed"),
+    ]
+
+    task         = models.CharField(max_length=200)
+    payload      = models.JSONField(default=dict, blank=True)
+    status       = models.CharField(max_length=16, choices=STATUS_CHOICES, default=PENDING)
+    attempts     = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    last_error   = models.TextField(blank=True)
+
+    # Scheduling / claiming
+    run_at    = models.DateTimeField(default=timezone.now)
+    locked_by = models.CharField(max_length=100, blank=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+
+    # Tracking
+    created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "run_at"], name="job_status_run_at_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.pk} ({self.status})"
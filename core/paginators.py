@@ -0,0 +1,57 @@
+from django.core.paginator import Paginator
+from django.db import DatabaseError, connections
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
+
+
+def estimate_row_count(model, using="default"):
+    """
+    Approximate row count from the planner statistics, or None if unavailable.
+
+    - PostgreSQL: `pg_class.reltuples` (maintained by autovacuum/ANALYZE).
+    - SQLite: `sqlite_stat1` (only present after ANALYZE).
+    """
+    connection = connections[using]
+    table = model._meta.db_table
+
+    if connection.vendor == "postgresql":
+        sql = "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass"
+        params = [connection.ops.quote_name(table)]
+    elif connection.vendor == "sqlite":
+        sql = "SELECT stat FROM sqlite_stat1 WHERE tbl = %s ORDER BY idx IS NOT NULL LIMIT 1"
+        params = [table]
+    else:
+        return None
+
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            row = cursor.fetchone()
+    except DatabaseError:
+        return None
+
+    if not row or row[0] is None:
+        return None
+    estimate = int(str(row[0]).split()[0])
+    return estimate if estimate >= 0 else None
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that avoids `COUNT(*)` over large unfiltered tables.
+
+    When the queryset has no WHERE clause and the statistics say the table is
+    bigger than `threshold`, the estimate is used as the count. Filtered
+    querysets (searches, list filters) and small tables are counted exactly.
+    """
+
+    threshold = 10_000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if isinstance(queryset, QuerySet) and not queryset.query.where:
+            estimate = estimate_row_count(queryset.model, queryset.db)
+            if estimate is not None and estimate >= self.threshold:
+                return estimate
+        return super().count
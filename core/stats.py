@@ -0,0 +1,12 @@
+"""
+Summary statistics shared by `manage.py loadtest` and the benchmark suite.
+"""
+import math
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
@@ -0,0 +1,79 @@
+import threading
+
+import pytest
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import CustomUser
+from core.views import BatchView, get_read_executor
+
+
+BATCH_URL = "/api/batch/"
+
+
+@pytest.fixture
+def auth_headers(transactional_db):
+    user = CustomUser.objects.create_user(
+        email="batch@example.com", password="secret123", first_name="Batch"
+    )
+    token = RefreshToken.for_user(user).access_token
+    return {"HTTP_AUTHORIZATION": f"Bearer {token}"}
+
+
+def batch(client, payload, headers):
+    return client.post(BATCH_URL, payload, content_type="application/json", **headers)
+
+
+def test_sub_requests_share_one_authentication(client, auth_headers):
+    response = batch(client, {"requests": [
+        {"method": "GET", "path": "/api/accounts/profile/"},
+        {"method": "PATCH", "path": "/api/accounts/profile/", "body": {"last_name": "Done"}},
+        {"method": "GET", "path": "/api/accounts/profile/"},
+        {"method": "GET", "path": "/api/accounts/users/"},
+    ]}, auth_headers)
+
+    assert response.status_code == 200
+    first, patched, after, users = response.json()["responses"]
+    assert first["status"] == 200 and first["body"]["email"] == "batch@example.com"
+    assert patched["status"] == 200
+    assert after["body"]["last_name"] == "Done"
+    assert users["status"] == 403  # permissions still apply per sub-request
+
+
+def test_unknown_and_nested_paths_fail_per_item(client, auth_headers):
+    response = batch(client, [
+        {"path": "/api/missing/"},
+        {"method": "POST", "path": BATCH_URL, "body": []},
+    ], auth_headers)
+
+    statuses = [item["status"] for item in response.json()["responses"]]
+    assert statuses == [404, 400]
+
+
+def test_batch_size_is_capped(client, auth_headers, settings):
+    settings.BATCH_MAX_REQUESTS = 2
+    response = batch(client, [{"path": "/api/accounts/profile/"}] * 3, auth_headers)
+
+    assert response.status_code == 400
+
+
+def test_invalid_credentials_reject_whole_batch(client, transactional_db):
+    response = batch(
+        client, [{"path": "/api/accounts/profile/"}], {"HTTP_AUTHORIZATION": "Bearer nope"}
+    )
+
+    assert response.status_code == 401
+
+
+def test_concurrent_reads_share_the_bounded_pool(client, auth_headers, monkeypatch):
+    threads = set()
+    dispatch_item = BatchView.dispatch_item
+    def record_thread(self, *args):
+        threads.add(threading.current_thread())
+        return dispatch_item(self, *args)
+    monkeypatch.setattr(BatchView, "dispatch_item", record_thread)
+
+    response = batch(client, [{"path": "/api/accounts/profile/"}] * 12, auth_headers)
+
+    assert {item["status"] for item in response.json()["responses"]} == {200}
+    assert len(threads) <= get_read_executor()._max_workers
+    assert all(thread.name.startswith("batch-read") for thread in threads)
@@ -0,0 +1,99 @@
+import threading
+import time
+
+import pytest
+from django.contrib.auth.models import Group
+from django.core.cache import caches
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import CustomUser
+from core.caching import TwoTierCache, cache
+
+
+@pytest.fixture(autouse=True)
+def clean_caches():
+    caches["default"].clear()
+    cache.clear_local()
+    yield
+    caches["default"].clear()
+    cache.clear_local()
+
+
+def test_local_tier_is_a_bounded_lru():
+    two_tier = TwoTierCache(local_max_entries=2)
+    two_tier.set("a", 1)
+    two_tier.set("b", 2)
+    two_tier.get("a")          # "b" is now least recently used
+    two_tier.set("c", 3)
+
+    assert set(two_tier.local) == {"a", "c"}
+    assert two_tier.get("b") == 2  # still served by the shared tier
+    assert two_tier.stats()["evictions"] >= 1
+
+
+def test_invalidating_a_tag_drops_both_tiers():
+    writer, other_process = TwoTierCache(), TwoTierCache()
+    writer.set("product-page", "v1", tags=["product:1", "category-tree"])
+    assert other_process.get("product-page") == "v1"
+
+    writer.invalidate_tags("category-tree")
+
+    assert writer.get("product-page") is None
+    other_process.clear_local()  # what its local TTL does within seconds
+    assert other_process.get("product-page") is None
+
+
+def test_get_or_set_computes_once_under_concurrency():
+    two_tier = TwoTierCache()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(two_tier.get_or_set("hot", compute)))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == ["value"] * 8
+    assert len(calls) == 1
+    stats = two_tier.stats()
+    assert stats["computes"] == 1 and stats["hit_rate"] > 0
+
+
+@pytest.mark.django_db
+def test_profile_cache_is_invalidated_by_user_save(client):
+    user = CustomUser.objects.create_user(email="cache@example.com", first_name="Before")
+    client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {RefreshToken.for_user(user).access_token}"
+
+    assert client.get("/api/accounts/profile/").json()["first_name"] == "Before"
+    hits = cache.stats().get("local_hits", 0)
+    assert client.get("/api/accounts/profile/").json()["first_name"] == "Before"
+    assert cache.stats()["local_hits"] == hits + 1
+
+    client.patch("/api/accounts/profile/", {"first_name": "After"}, content_type="application/json")
+
+    assert client.get("/api/accounts/profile/").json()["first_name"] == "After"
+
+
+@pytest.mark.django_db
+def test_profile_cache_is_invalidated_by_group_changes_from_either_side(client):
+    user = CustomUser.objects.create_user(email="groups@example.com")
+    group = Group.objects.create(name="staff")
+    client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {RefreshToken.for_user(user).access_token}"
+    groups = lambda: client.get("/api/accounts/profile/").json()["groups"]
+
+    assert groups() == []
+    user.groups.add(group)
+    assert groups() == [group.pk]
+    group.user_set.clear()
+    assert groups() == []
+    group.user_set.add(user)
+    assert groups() == [group.pk]
@@ -0,0 +1,107 @@
+import asyncio
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.http import JsonResponse
+
+from accounts.models import CustomUser
+from core.middleware import IdempotencyMiddleware
+from core.models import IdempotencyRecord
+
+
+REGISTER_URL = "/api/accounts/register/"
+
+
+def register(client, key, email="retry@example.com"):
+    return client.post(
+        REGISTER_URL,
+        {"email": email, "first_name": "Retry", "password": "secret123"},
+        content_type="application/json",
+        HTTP_IDEMPOTENCY_KEY=key,
+    )
+
+
+@pytest.mark.django_db
+def test_retry_replays_first_response_without_running_view(client):
+    first = register(client, "key-1")
+    second = register(client, "key-1")
+
+    assert first.status_code == 201
+    assert second.status_code == 201
+    assert second.content == first.content
+    assert second["Idempotent-Replayed"] == "true"
+    assert CustomUser.objects.filter(email="retry@example.com").count() == 1
+
+
+@pytest.mark.django_db
+def test_key_reused_for_different_request_is_rejected(client):
+    register(client, "key-2")
+    response = register(client, "key-2", email="other@example.com")
+
+    assert response.status_code == 422
+    assert not CustomUser.objects.filter(email="other@example.com").exists()
+
+
+@pytest.mark.django_db
+def test_in_flight_duplicate_times_out_with_conflict(client, settings):
+    settings.IDEMPOTENCY_WAIT_TIMEOUT = 0
+    register(client, "key-3")
+    # Pretend the first request is still running
+    IdempotencyRecord.objects.filter(key="key-3").update(status=IdempotencyRecord.IN_PROGRESS)
+
+    response = register(client, "key-3")
+
+    assert response.status_code == 409
+    assert CustomUser.objects.filter(email="retry@example.com").count() == 1
+
+
+@pytest.mark.django_db
+def test_requests_without_key_are_untouched(client):
+    register(client, "")
+    assert IdempotencyRecord.objects.count() == 0
+
+
+@pytest.mark.django_db(transaction=True)
+def test_async_stack_replays_and_waits_without_blocking(async_client, settings):
+    settings.IDEMPOTENCY_WAIT_TIMEOUT = 0.3
+
+    async def scenario():
+        kwargs = {"content_type": "application/json", "headers": {"Idempotency-Key": "async-key"}}
+        body = {"email": "async@example.com", "first_name": "Async", "password": "secret123"}
+        first = await async_client.post(REGISTER_URL, body, **kwargs)
+        second = await async_client.post(REGISTER_URL, body, **kwargs)
+        await IdempotencyRecord.objects.filter(key="async-key").aupdate(status=IdempotencyRecord.IN_PROGRESS)
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticking = asyncio.create_task(ticker())
+        waiting = await async_client.post(REGISTER_URL, body, **kwargs)
+        ticking.cancel()
+        return first, second, waiting, ticks
+
+    first, second, waiting, ticks = async_to_sync(scenario)()
+
+    assert first.status_code == 201
+    assert second["Idempotent-Replayed"] == "true"
+    assert waiting.status_code == 409
+    assert ticks > 5  # the event loop kept running while the retry waited
+    assert CustomUser.objects.filter(email="async@example.com").count() == 1
+
+
+@pytest.mark.django_db
+def test_request_whose_claim_was_reaped_still_returns_its_response(rf):
+    def slow_view(request):
+        # A retry reaped our claim and took the key while we were running
+        IdempotencyRecord.objects.all().delete()
+        return JsonResponse({"ok": True}, status=201)
+
+    middleware = IdempotencyMiddleware(slow_view)
+    response = middleware(rf.post(REGISTER_URL, {}, content_type="application/json", HTTP_IDEMPOTENCY_KEY="key-4"))
+
+    assert response.status_code == 201
+    assert not IdempotencyRecord.objects.exists()
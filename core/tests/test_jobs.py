@@ -0,0 +1,106 @@
+import pytest
+from django.core import mail
+
+from accounts.models import CustomUser
+from core.jobs import claim_jobs, enqueue, run_jobs, task
+from core.models import Job
+
+
+batches = []
+
+
+@task(name="tests.flaky", max_attempts=2)
+def flaky(**payload):
+    raise RuntimeError("boom")
+
+
+@task(name="tests.collect", batch=True)
+def collect(payloads):
+    batches.append(payloads)
+
+
+@task(name="tests.reject_odd", batch=True)
+def reject_odd(payloads):
+    return [index for index, payload in enumerate(payloads) if payload["n"] % 2]
+
+
+@pytest.mark.django_db
+def test_register_queues_welcome_email_sent_by_worker(client, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(
+            "/api/accounts/register/",
+            {"email": "jobs@example.com", "first_name": "Jo", "password": "secret123"},
+            content_type="application/json",
+        )
+    assert response.status_code == 201
+    assert len(mail.outbox) == 0
+
+    jobs = claim_jobs("worker-1", limit=10)
+    assert [job.task for job in jobs] == ["accounts.tasks.send_welcome_email"]
+    assert run_jobs(jobs) == (1, 0)
+    assert mail.outbox[0].to == ["jobs@example.com"]
+    assert not Job.objects.exists()
+
+
+@pytest.mark.django_db
+def test_similar_jobs_are_batched_into_one_call():
+    users = [CustomUser.objects.create_user(email=f"u{i}@example.com") for i in range(3)]
+    for user in users:
+        enqueue("accounts.tasks.send_welcome_email", {"user_id": user.pk})
+        enqueue(collect, {"n": user.pk})
+
+    assert run_jobs(claim_jobs("worker-1", limit=10)) == (6, 0)
+    assert len(mail.outbox) == 3
+    assert len(batches) == 1 and len(batches[0]) == 3
+
+
+@pytest.mark.django_db
+def test_only_failed_payloads_of_a_batch_are_retried(monkeypatch):
+    users = [CustomUser.objects.create_user(email=f"u{i}@example.com") for i in range(3)]
+    for user in users:
+        enqueue("accounts.tasks.send_welcome_email", {"user_id": user.pk})
+
+    send = mail.EmailMessage.send
+    def send_or_fail(message, *args, **kwargs):
+        if message.to == ["u1@example.com"]:
+            raise OSError("mailbox unavailable")
+        return send(message, *args, **kwargs)
+    monkeypatch.setattr(mail.EmailMessage, "send", send_or_fail)
+
+    assert run_jobs(claim_jobs("worker-1", limit=10)) == (2, 1)
+    assert sorted(message.to[0] for message in mail.outbox) == ["u0@example.com", "u2@example.com"]
+    retried = Job.objects.get()
+    assert retried.payload == {"user_id": users[1].pk}
+    assert retried.status == Job.PENDING and retried.attempts == 1
+
+
+@pytest.mark.django_db
+def test_batch_failures_are_matched_by_index_not_payload_identity():
+    for n in (1, 2, 1):  # equal payloads must not be confused either
+        enqueue(reject_odd, {"n": n})
+
+    assert run_jobs(claim_jobs("worker-1", limit=10)) == (1, 2)
+    assert sorted(job.payload["n"] for job in Job.objects.all()) == [1, 1]
+
+
+@pytest.mark.django_db
+def test_failed_job_is_retried_with_backoff_then_marked_failed():
+    job = enqueue(flaky)
+
+    run_jobs(claim_jobs("worker-1", limit=10))
+    job.refresh_from_db()
+    assert job.status == Job.PENDING and job.attempts == 1
+    assert job.run_at > job.created_at
+    assert claim_jobs("worker-1", limit=10) == []  # not due yet
+
+    Job.objects.filter(pk=job.pk).update(run_at=job.created_at)
+    run_jobs(claim_jobs("worker-1", limit=10))
+    job.refresh_from_db()
+    assert job.status == Job.FAILED and "boom" in job.last_error
+
+
+@pytest.mark.django_db
+def test_claimed_jobs_are_not_claimed_twice():
+    enqueue(flaky)
+    assert len(claim_jobs("worker-1", limit=10)) == 1
+    assert claim_jobs("worker-2", limit=10) == []
@@ -0,0 +1,32 @@
+import json
+
+import pytest
+from django.core.management import call_command
+
+from accounts.models import CustomUser
+from core.stats import percentile
+
+
+def test_percentile_uses_nearest_rank():
+    values = list(range(1, 101))
+
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([7], 95) == 7
+    assert percentile([], 50) is None
+
+
+@pytest.mark.parametrize("mode", ["wsgi", "asgi"])
+def test_loadtest_runs_scenario_and_cleans_up(mode, transactional_db, settings, tmp_path):
+    settings.PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+    report_path = tmp_path / "report.json"
+
+    clients = 3  # concurrent writers: relies on the file-backed test database (conftest.py)
+    call_command("loadtest", mode=mode, clients=clients, iterations=2, json_path=str(report_path))
+
+    report = json.loads(report_path.read_text())
+    assert report["clients"] == clients
+    assert report["requests"] == 10 * clients
+    assert report["errors"] == 0
+    assert report["endpoints"]["logout"]["p99_ms"] is not None
+    assert not CustomUser.objects.exists()
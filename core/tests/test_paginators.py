@@ -0,0 +1,20 @@
+import pytest
+
+from accounts.models import CustomUser
+from core.paginators import EstimatedCountPaginator
+
+
+@pytest.mark.django_db
+def test_estimate_is_only_used_for_unfiltered_querysets(monkeypatch):
+    CustomUser.objects.create_user(email="a@example.com")
+    monkeypatch.setattr("core.paginators.estimate_row_count", lambda model, using: 50_000)
+
+    assert EstimatedCountPaginator(CustomUser.objects.all(), 10).count == 50_000
+    assert EstimatedCountPaginator(CustomUser.objects.filter(is_staff=False), 10).count == 1
+
+
+@pytest.mark.django_db
+def test_missing_statistics_fall_back_to_count():
+    CustomUser.objects.create_user(email="a@example.com")
+
+    assert EstimatedCountPaginator(CustomUser.objects.all(), 10).count == 1
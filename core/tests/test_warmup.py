@@ -0,0 +1,17 @@
+import gc
+
+from core.warmup import warm_up
+
+
+def test_warm_up_can_be_disabled(settings):
+    settings.WARMUP_ON_STARTUP = False
+    assert warm_up() == {}
+
+
+def test_warm_up_runs_every_step():
+    try:
+        timings = warm_up(force=True)
+    finally:
+        gc.unfreeze()
+
+    assert set(timings) == {"translations", "urls", "views", "auth"}
@@ -0,0 +1,8 @@
+from django.urls import path
+from .views import BatchView
+
+
+urlpatterns = [
+    # Multiplex several API calls into one round-trip
+    path("batch/", BatchView.as_view(), name="batch"),
+]
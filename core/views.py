@@ -0,0 +1,199 @@
+import asyncio
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from urllib.parse import urlsplit
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import close_old_connections
+from django.http import JsonResponse
+from django.urls import Resolver404, resolve
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+
+logger = logging.getLogger(__name__)
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+ALLOWED_METHODS = SAFE_METHODS + ("POST", "PUT", "PATCH", "DELETE")
+
+# Request metadata inherited by every sub-request (credentials are NOT copied:
+# the batch is authenticated once and the user is forced onto sub-requests)
+INHERITED_META = (
+    "SERVER_NAME", "SERVER_PORT", "REMOTE_ADDR", "HTTP_HOST",
+    "HTTP_USER_AGENT", "HTTP_ACCEPT_LANGUAGE",
+)
+
+# Read-only sub-requests of every batch share this pool, so at most
+# BATCH_READ_CONCURRENCY extra DB connections exist per process; its threads
+# keep their connections between batches subject to CONN_MAX_AGE.
+_read_executor = None
+
+
+def get_read_executor():
+    global _read_executor
+    if _read_executor is None:
+        _read_executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, "BATCH_READ_CONCURRENCY", 4),
+            thread_name_prefix="batch-read",
+        )
+    return _read_executor
+
+
+class BatchView(View):
+    """
+    Batch Request API
+
+    - Accepts `{"requests": [{"method", "path", "body"}, ...]}` (or a bare list).
+    - Authenticates the caller once and forces that user onto every sub-request,
+      so JWT decoding and the user lookup are not repeated per item.
+    - Dispatches sub-requests through the URL resolver, skipping HTTP and middleware.
+    - Consecutive read-only sub-requests run concurrently on a small shared
+      thread pool (`BATCH_READ_CONCURRENCY`); writes run in order and act as
+      barriers between them.
+    - Returns `{"responses": [{"status", "body"}, ...]}` in request order.
+    """
+
+    http_method_names = ["post"]
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        # Like DRF's APIView: CSRF is enforced by SessionAuthentication instead
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    async def post(self, request, *args, **kwargs):
+        try:
+            items = self.parse_items(request.body)
+        except ValueError as exc:
+            return JsonResponse({"error": str(exc)}, status=400)
+
+        try:
+            user, auth = await sync_to_async(self.authenticate)(request)
+        except exceptions.APIException as exc:
+            return JsonResponse({"error": str(exc.detail)}, status=exc.status_code)
+
+        responses = [None] * len(items)
+        pending_reads = []
+        for index, item in enumerate(items):
+            if item["method"] in SAFE_METHODS:
+                pending_reads.append(index)
+                continue
+            await self.run_concurrently(request, user, auth, items, pending_reads, responses)
+            pending_reads = []
+            responses[index] = await sync_to_async(self.dispatch_item)(request, user, auth, item)
+        await self.run_concurrently(request, user, auth, items, pending_reads, responses)
+
+        return JsonResponse({"responses": responses})
+
+    # ----------------------------------------------------------------
+    # Helpers
+    # ----------------------------------------------------------------
+    def parse_items(self, body):
+        """Validate the batch payload and normalise each sub-request."""
+        try:
+            payload = json.loads(body or b"null")
+        except json.JSONDecodeError:
+            raise ValueError("Request body must be valid JSON.")
+
+        items = payload.get("requests") if isinstance(payload, dict) else payload
+        if not isinstance(items, list) or not items:
+            raise ValueError("Expected a non-empty list of requests.")
+
+        max_requests = getattr(settings, "BATCH_MAX_REQUESTS", 20)
+        if len(items) > max_requests:
+            raise ValueError(f"A batch may contain at most {max_requests} requests.")
+
+        normalised = []
+        for item in items:
+            if not isinstance(item, dict) or not isinstance(item.get("path"), str):
+                raise ValueError("Each request needs at least a 'path'.")
+            method = str(item.get("method", "GET")).upper()
+            if method not in ALLOWED_METHODS:
+                raise ValueError(f"Method '{method}' is not allowed in a batch.")
+            normalised.append({"method": method, "path": item["path"], "body": item.get("body")})
+        return normalised
+
+    def authenticate(self, request):
+        """Run the DRF authenticators once for the whole batch."""
+        drf_request = Request(
+            request,
+            authenticators=[auth() for auth in api_settings.DEFAULT_AUTHENTICATION_CLASSES],
+        )
+        return drf_request.user, drf_request.auth
+
+    async def run_concurrently(self, request, user, auth, items, indexes, responses):
+        """Dispatch independent read-only sub-requests on the shared read pool."""
+        if not indexes:
+            return
+        executor = get_read_executor()
+        results = await asyncio.gather(*[
+            sync_to_async(self.dispatch_isolated, thread_sensitive=False, executor=executor)(
+                request, user, auth, items[index]
+            )
+            for index in indexes
+        ])
+        for index, result in zip(indexes, results):
+            responses[index] = result
+
+    def dispatch_isolated(self, request, user, auth, item):
+        """Dispatch on a pool thread, recycling its connections like a request would."""
+        close_old_connections()
+        try:
+            return self.dispatch_item(request, user, auth, item)
+        finally:
+            close_old_connections()
+
+    def dispatch_item(self, request, user, auth, item):
+        """Build a sub-request, resolve it and call the view directly."""
+        url = urlsplit(item["path"])
+        try:
+            match = resolve(url.path)
+        except Resolver404:
+            return {"status": 404, "body": {"error": "Not found."}}
+
+        if getattr(match.func, "view_class", None) is self.__class__:
+            return {"status": 400, "body": {"error": "Batch requests cannot be nested."}}
+
+        sub_request = self.build_request(request, item["method"], url, item["body"])
+        sub_request.resolver_match = match
+        # Picked up by DRF's Request: skips re-authenticating every sub-request
+        sub_request._force_auth_user = user
+        sub_request._force_auth_token = auth
+
+        try:
+            response = match.func(sub_request, *match.args, **match.kwargs)
+            if hasattr(response, "render"):
+                response = response.render()
+        except Exception:
+            logger.exception("Batch sub-request to %s failed", item["path"])
+            return {"status": 500, "body": {"error": "Internal server error."}}
+
+        return {"status": response.status_code, "body": self.decode_body(response)}
+
+    def build_request(self, request, method, url, body):
+        content = b"" if body is None else json.dumps(body).encode()
+        environ = {key: request.META[key] for key in INHERITED_META if key in request.META}
+        environ.update({
+            "REQUEST_METHOD": method,
+            "PATH_INFO": url.path,
+            "SCRIPT_NAME": "",
+            "QUERY_STRING": url.query,
+            "CONTENT_TYPE": "application/json",
+            "CONTENT_LENGTH": str(len(content)),
+            "wsgi.input": BytesIO(content),
+            "wsgi.url_scheme": request.scheme,
+        })
+        return WSGIRequest(environ)
+
+    def decode_body(self, response):
+        if not response.content:
+            return None
+        if response.get("Content-Type", "").startswith("application/json"):
+            return json.loads(response.content)
+        return response.content.decode(response.charset, errors="replace")
@@ -0,0 +1,105 @@
+"""
+Worker warm-up.
+
+Called from `drfcommerce/wsgi.py` and `drfcommerce/asgi.py` right after the
+application is created, so the lazy work Django, DRF and SimpleJWT would
+otherwise do on the first requests happens before the worker accepts traffic.
+
+With a preforking server that loads the app in the master (e.g. gunicorn
+`--preload`), warm-up runs once and the children inherit the result:
+database connections are closed before forking and the warmed objects are
+moved out of the garbage collector's reach (`gc.freeze`) so they are not
+copied into every child by reference-count/GC writes.
+"""
+import gc
+import logging
+import time
+
+from django.conf import settings
+from django.contrib.auth.hashers import get_hasher, get_hashers
+from django.db import connections
+from django.urls import URLPattern, URLResolver, get_resolver
+from django.utils import translation
+
+
+logger = logging.getLogger(__name__)
+
+
+def iter_views(patterns):
+    """Yield every view callable reachable from the URLconf (imports includes)."""
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from iter_views(pattern.url_patterns)
+        elif isinstance(pattern, URLPattern):
+            yield pattern.callback
+
+
+def warm_urls():
+    resolver = get_resolver()
+    resolver.reverse_dict  # compiles and caches every pattern
+    return list(iter_views(resolver.url_patterns))
+
+
+def warm_views(views):
+    """Instantiate DRF views and build their auth/permission classes and serializer fields."""
+    for view in views:
+        view_class = getattr(view, "cls", None)  # set by APIView.as_view()
+        if view_class is None:
+            continue
+        try:
+            instance = view_class(**getattr(view, "initkwargs", {}))
+            instance.get_authenticators()
+            instance.get_permissions()
+            serializer_class = getattr(instance, "serializer_class", None)
+            if serializer_class is not None:
+                serializer_class(context={}).fields
+        except Exception:
+            logger.debug("Skipping warm-up of %r", view_class, exc_info=True)
+
+
+def warm_translations():
+    """Load the message catalogs for the default language."""
+    translation.activate(settings.LANGUAGE_CODE)
+    translation.deactivate()
+
+
+def warm_auth():
+    """Load password hashers and exercise JWT encode/decode once."""
+    get_hashers()
+    get_hasher("default")
+
+    from rest_framework_simplejwt.tokens import AccessToken
+    AccessToken(str(AccessToken()))
+
+
+def warm_up(force=False):
+    """
+    Preload everything a worker needs before serving requests.
+
+    Returns a `{step: milliseconds}` mapping (empty when disabled by
+    `WARMUP_ON_STARTUP` and not forced).
+    """
+    if not force and not getattr(settings, "WARMUP_ON_STARTUP", True):
+        return {}
+
+    timings = {}
+
+    def step(name, func, *args):
+        started = time.perf_counter()
+        result = func(*args)
+        timings[name] = (time.perf_counter() - started) * 1000
+        return result
+
+    step("translations", warm_translations)
+    views = step("urls", warm_urls)
+    step("views", warm_views, views)
+    step("auth", warm_auth)
+
+    # Fork-friendliness: never share DB sockets with children, and keep the
+    # warmed objects out of future GC passes (avoids copy-on-write faults)
+    connections.close_all()
+    gc.collect()
+    gc.freeze()
+
+    logger.info("Worker warm-up finished: %s", timings)
+    return timings
@@ -14,3 +14,9 @@ from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "drfcommerce.settings")
 
 application = get_asgi_application()
+
+# Preload URLs, views, serializers and auth state before accepting traffic
+# (disable with WARMUP_ON_STARTUP=False)
+from core.warmup import warm_up  # noqa: E402
+
+warm_up()
@@ -37,12 +37,14 @@ INSTALLED_APPS = [
     "django.contrib.staticfiles",
 
     # Local apps
+    "core",
     "main",
     "accounts",
 
     # Third-party
     "rest_framework",
     "rest_framework_simplejwt",
+    "rest_framework_simplejwt.token_blacklist",  # required by BLACKLIST_AFTER_ROTATION / logout
     "corsheaders",
 ]
 
@@ -56,6 +58,7 @@ MIDDLEWARE = [
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    "core.middleware.IdempotencyMiddleware",  # after auth (uses session user)
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
@@ -93,6 +96,23 @@ DATABASES = {
     }
 }
 
+# -------------------------------------------------------------------
+# Cache (local memory by default; point at Redis/Memcached in production,
+# e.g. CACHE_BACKEND=django.core.cache.backends.redis.RedisCache)
+# -------------------------------------------------------------------
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "drfcommerce"),
+        "TIMEOUT": 300,
+    }
+}
+
+# Two-tier cache (core.caching): per-process LRU in front of CACHES["default"]
+TWO_TIER_CACHE_ALIAS = "default"
+TWO_TIER_CACHE_LOCAL_MAX_ENTRIES = 1024  # per-process LRU size
+TWO_TIER_CACHE_LOCAL_TIMEOUT = 5         # seconds; bounds cross-process staleness
+
 # -------------------------------------------------------------------
 # Password validation
 # -------------------------------------------------------------------
@@ -170,6 +190,63 @@ SIMPLE_JWT = {
     "TOKEN_USER_CLASS": "rest_framework_simplejwt.models.TokenUser",
 }
 
+# -------------------------------------------------------------------
+# Idempotency-Key support for unsafe methods (core.middleware)
+# -------------------------------------------------------------------
+IDEMPOTENCY_KEY_TTL = timedelta(hours=24)          # how long a stored response is replayed
+IDEMPOTENCY_IN_FLIGHT_TTL = timedelta(minutes=10)  # after this an unfinished request is abandoned
+                                                   # (keep above the worker/request timeout)
+IDEMPOTENCY_WAIT_TIMEOUT = 10                      # seconds a retry waits for the in-flight request
+
+# -------------------------------------------------------------------
+# Batch endpoint (core.views.BatchView)
+# -------------------------------------------------------------------
+BATCH_MAX_REQUESTS = 20  # max sub-requests accepted in one `api/batch/` call
+BATCH_READ_CONCURRENCY = 4  # threads (and DB connections) shared by all batches' reads
+
+# -------------------------------------------------------------------
+# Background jobs (core.jobs, run with `manage.py run_jobs`)
+# -------------------------------------------------------------------
+JOB_MAX_ATTEMPTS = 5          # attempts before a job is marked failed
+JOB_RETRY_BASE_DELAY = 10     # seconds; doubled after every failed attempt
+JOB_RETRY_MAX_DELAY = 3600    # cap for the retry backoff
+JOB_VISIBILITY_TIMEOUT = 300  # seconds before a job held by a dead worker is retried
+
+# -------------------------------------------------------------------
+# Worker warm-up (core.warmup, run from wsgi.py / asgi.py)
+# -------------------------------------------------------------------
+WARMUP_ON_STARTUP = os.getenv("WARMUP_ON_STARTUP", "True") == "True"
+
+# -------------------------------------------------------------------
+# PIN-code serviceability index (main.pincodes, built by build_pincode_index)
+# -------------------------------------------------------------------
+PINCODE_INDEX_PATH = os.getenv("PINCODE_INDEX_PATH", str(BASE_DIR / "data" / "pincodes.idx"))
+PINCODE_CHECK_MAX = 500  # PIN codes accepted per batch check
+
+# -------------------------------------------------------------------
+# Catalog import (main.catalog_import, run by import_catalog)
+# -------------------------------------------------------------------
+CATALOG_IMPORT_CHUNK_SIZE = 1000  # rows validated and upserted per batch
+
+# -------------------------------------------------------------------
+# Recommendations (main.recommendations, run by build_recommendations)
+# -------------------------------------------------------------------
+RECOMMENDATIONS_TOP_K = 10               # neighbours stored per product
+RECOMMENDATIONS_BATCH_SIZE = 1000        # orders folded into the matrix per batch
+RECOMMENDATIONS_ORDER_LAG = timedelta(minutes=10)  # only fold orders older than this (late commits)
+RECOMMENDATIONS_CACHE_TIMEOUT = 60 * 60  # seconds a served list stays cached
+
+# -------------------------------------------------------------------
+# Authentication audit log (accounts.audit)
+# -------------------------------------------------------------------
+AUDIT_LOG_SINK = os.getenv("AUDIT_LOG_SINK", "database")  # "database" or "jsonl"
+AUDIT_LOG_DIR = os.getenv("AUDIT_LOG_DIR", str(BASE_DIR / "logs" / "audit"))  # jsonl sink only
+AUDIT_BUFFER_SIZE = 10000      # events held in memory; the oldest are dropped beyond this
+AUDIT_FLUSH_BATCH_SIZE = 500   # events per bulk write
+AUDIT_FLUSH_INTERVAL = 1.0     # seconds between background flushes
+AUDIT_BACKGROUND_FLUSH = True  # False: events are written only by audit.flush()
+AUDIT_RETENTION_DAYS = 90      # purge_auth_events deletes older events and files
+
 # -------------------------------------------------------------------
 # CORS (read from .env or fallback to local dev)
 # -------------------------------------------------------------------
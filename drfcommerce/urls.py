@@ -5,6 +5,8 @@ This routes all the top-level endpoints of the project:
 - Admin dashboard
 - DRF's browsable API login/logout
 - Accounts app (authentication, registration, profile, JWT)
+- Core app (batch endpoint)
+- Main app (store endpoints such as PIN-code checks)
 """
 
 from django.contrib import admin
@@ -22,4 +24,10 @@ urlpatterns = [
     # All routes inside accounts/urls.py are automatically
     # prefixed with `api/accounts/`
     path("api/accounts/", include("accounts.urls")),
+
+    # Core app (cross-cutting API endpoints such as `api/batch/`)
+    path("api/", include("core.urls")),
+
+    # Main app (store endpoints)
+    path("api/", include("main.urls")),
 ]
@@ -0,0 +1,46 @@
+from django.contrib import admin
+from .models import Category, Order, OrderItem, Product
+
+
+@admin.register(Category)
+class CategoryAdmin(admin.ModelAdmin):
+    """Admin panel configuration for Category model"""
+
+    list_display = ("id", "name", "slug", "parent")
+    search_fields = ("slug",)
+    list_select_related = ("parent",)
+    prepopulated_fields = {"slug": ("name",)}
+
+
+@admin.register(Product)
+class ProductAdmin(admin.ModelAdmin):
+    """Admin panel configuration for Product model"""
+
+    list_display = ("id", "sku", "name", "price", "stock", "category", "is_active", "updated_at")
+    list_filter = ("is_active",)
+    list_select_related = ("category",)
+    search_fields = ("=sku", "name")
+    readonly_fields = ("content_hash", "created_at", "updated_at")
+
+
+class OrderItemInline(admin.TabularInline):
+    """Items are fixed once placed (the order total and summary derive from them)."""
+    model = OrderItem
+    extra = 0
+    readonly_fields = ("product", "quantity", "unit_price")
+    can_delete = False
+
+    def has_add_permission(self, request, obj=None):
+        return False
+
+
+@admin.register(Order)
+class OrderAdmin(admin.ModelAdmin):
+    """Admin panel configuration for Order model"""
+
+    list_display = ("id", "user", "status", "total", "created_at")
+    list_filter = ("status",)
+    list_select_related = ("user",)
+    raw_id_fields = ("user",)
+    readonly_fields = ("total", "created_at", "updated_at")
+    inlines = [OrderItemInline]
@@ -4,3 +4,18 @@ from django.apps import AppConfig
 class MainConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "main"
+
+    def ready(self):
+        from django.db.models.signals import post_delete, post_save
+
+        from core.caching import invalidate_on_change
+        from .models import Category, Order, OrderItem, Product
+        from .recommendations import dependent_tags, invalidate_imported
+        from .signals import catalog_batch_imported, sync_order_summary
+
+        invalidate_on_change(Product, lambda product: [f"product:{product.pk}", *dependent_tags([product.pk])])
+        catalog_batch_imported.connect(invalidate_imported, dispatch_uid="main.recommendations")
+        invalidate_on_change(Category, lambda category: ["category-tree"])
+        post_save.connect(sync_order_summary, sender=Order, dispatch_uid="main.order_summary")
+        post_save.connect(sync_order_summary, sender=OrderItem, dispatch_uid="main.order_summary")
+        post_delete.connect(sync_order_summary, sender=OrderItem, dispatch_uid="main.order_summary")
@@ -0,0 +1,294 @@
+"""
+Streaming catalog import.
+
+Feeds (CSV with a header row, or JSON Lines) are read lazily and processed in
+chunks of `CATALOG_IMPORT_CHUNK_SIZE` rows. Per chunk:
+
+- rows are validated and normalised; invalid rows are reported, not fatal
+- a content hash of each row is compared with the stored one (cleared by
+  any write outside the importer), so unchanged products cost nothing
+  beyond one `SELECT ... WHERE sku IN (...)`
+- missing categories are created once for the whole chunk
+- changed rows are written with a single `bulk_create(update_conflicts=True)`
+  upsert on `sku`
+- caches are invalidated and `catalog_batch_imported` is sent once
+
+Feed columns: `sku, name, price` (required), `description, stock, category,
+image_url, is_active` (optional). `category` is a slug path such as
+`electronics/phones`; unknown categories are created under their parent.
+"""
+import csv
+import hashlib
+import itertools
+import json
+import time
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import slugify
+
+from core.caching import cache
+from .models import Category, Product
+from .signals import catalog_batch_imported
+
+
+UPSERT_FIELDS = [
+    "name", "description", "price", "stock", "category", "image_url", "is_active",
+    "content_hash", "updated_at",
+]
+TRUE_VALUES = {"1", "true", "yes", "y"}
+FALSE_VALUES = {"0", "false", "no", "n"}
+MAX_PRICE = Decimal("99999999.99")
+MAX_STOCK = 2147483647  # PositiveIntegerField is a 32-bit integer column
+MAX_REPORTED_ERRORS = 100
+
+
+class RowError(ValueError):
+    pass
+
+
+@dataclass
+class ImportStats:
+    rows: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    duplicates: int = 0  # earlier rows of a SKU repeated within the same chunk
+    invalid: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+    errors: list = field(default_factory=list)  # (line, message), capped
+
+    @property
+    def rows_per_second(self):
+        return round(self.rows / self.elapsed, 1) if self.elapsed else 0.0
+
+    def add_error(self, line, message):
+        self.invalid += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append((line, message))
+
+
+# -------------------------------------------------------------------
+# Reading
+# -------------------------------------------------------------------
+
+def detect_format(path):
+    return "jsonl" if Path(path).suffix.lower() in (".jsonl", ".ndjson") else "csv"
+
+
+def read_rows(fh, fmt):
+    """Yield `(line number, row dict)` pairs without loading the whole feed."""
+    if fmt == "csv":
+        reader = csv.DictReader(fh)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line, text in enumerate(fh, start=1):
+        if not text.strip():
+            continue
+        try:
+            row = json.loads(text)
+        except ValueError:
+            yield line, None
+            continue
+        yield line, row if isinstance(row, dict) else None
+
+
+# -------------------------------------------------------------------
+# Validation
+# -------------------------------------------------------------------
+
+def _text(row, key):
+    value = row.get(key)
+    return "" if value is None else str(value).strip()
+
+
+def clean_row(row):
+    """Return the normalised product fields of a feed row; raise RowError if invalid."""
+    if row is None:
+        raise RowError("Row is not a JSON object.")
+
+    sku = _text(row, "sku")
+    if not sku:
+        raise RowError("Missing sku.")
+    if len(sku) > 64:
+        raise RowError(f"sku {sku!r} is longer than 64 characters.")
+
+    name = _text(row, "name")
+    if not name:
+        raise RowError(f"{sku}: missing name.")
+    if len(name) > 255:
+        raise RowError(f"{sku}: name is longer than 255 characters.")
+
+    try:
+        price = Decimal(_text(row, "price")).quantize(Decimal("0.01"))
+    except InvalidOperation:
+        raise RowError(f"{sku}: invalid price {row.get('price')!r}.")
+    if not price.is_finite() or price < 0 or price > MAX_PRICE:
+        raise RowError(f"{sku}: price out of range.")
+
+    stock = _text(row, "stock") or "0"
+    if not (stock.isascii() and stock.isdigit()):
+        raise RowError(f"{sku}: invalid stock {row.get('stock')!r}.")
+    if int(stock) > MAX_STOCK:
+        raise RowError(f"{sku}: stock out of range.")
+
+    is_active = _text(row, "is_active").lower() or "true"
+    if is_active not in TRUE_VALUES | FALSE_VALUES:
+        raise RowError(f"{sku}: invalid is_active {row.get('is_active')!r}.")
+
+    image_url = _text(row, "image_url")
+    if image_url and not image_url.startswith(("http://", "https://")):
+        raise RowError(f"{sku}: image_url must be an http(s) URL.")
+    if len(image_url) > 500:
+        raise RowError(f"{sku}: image_url is longer than 500 characters.")
+
+    category = "/".join(slugify(part) for part in _text(row, "category").split("/") if slugify(part))
+
+    return {
+        "sku": sku,
+        "name": name,
+        "description": _text(row, "description"),
+        "price": price,
+        "stock": int(stock),
+        "category": category,
+        "image_url": image_url,
+        "is_active": is_active in TRUE_VALUES,
+    }
+
+
+def content_hash(cleaned):
+    payload = json.dumps(cleaned, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+# -------------------------------------------------------------------
+# Importing
+# -------------------------------------------------------------------
+
+class CatalogImporter:
+    """
+    Import a stream of feed rows; reuse one instance per feed so category
+    lookups are cached across chunks.
+
+        with open(path, newline="", encoding="utf-8") as fh:
+            stats = CatalogImporter().run(read_rows(fh, detect_format(path)))
+    """
+
+    def __init__(self, chunk_size=None, dry_run=False):
+        self.chunk_size = chunk_size or getattr(settings, "CATALOG_IMPORT_CHUNK_SIZE", 1000)
+        self.dry_run = dry_run
+        self.category_ids = {}  # slug path -> id
+        self.stats = ImportStats()
+
+    def run(self, rows):
+        started = time.perf_counter()
+        rows = iter(rows)
+        while chunk := list(itertools.islice(rows, self.chunk_size)):
+            self.import_chunk(chunk)
+        self.stats.elapsed = time.perf_counter() - started
+        return self.stats
+
+    def import_chunk(self, chunk):
+        self.stats.rows += len(chunk)
+        self.stats.batches += 1
+
+        # Validate; a SKU repeated within the chunk keeps its last row
+        cleaned = {}
+        for line, row in chunk:
+            try:
+                item = clean_row(row)
+            except RowError as exc:
+                self.stats.add_error(line, str(exc))
+                continue
+            if item["sku"] in cleaned:
+                self.stats.duplicates += 1
+            cleaned[item["sku"]] = item
+        if not cleaned:
+            return
+
+        existing = {
+            sku: (pk, digest)
+            for sku, pk, digest in Product.objects.filter(sku__in=list(cleaned))
+            .values_list("sku", "id", "content_hash")
+        }
+        changed = []
+        for sku, item in cleaned.items():
+            item["content_hash"] = content_hash(item)
+            if sku in existing and existing[sku][1] == item["content_hash"]:
+                self.stats.unchanged += 1
+            else:
+                changed.append(item)
+        if not changed:
+            return
+
+        created = sum(1 for item in changed if item["sku"] not in existing)
+        self.stats.created += created
+        self.stats.updated += len(changed) - created
+        if self.dry_run:
+            return
+
+        with transaction.atomic():
+            self.resolve_categories({item["category"] for item in changed})
+            now = timezone.now()
+            products = Product.objects.bulk_create(
+                [
+                    Product(
+                        **{key: value for key, value in item.items() if key != "category"},
+                        category_id=self.category_ids.get(item["category"]),
+                        created_at=now,
+                        updated_at=now,
+                    )
+                    for item in changed
+                ],
+                update_conflicts=True,
+                unique_fields=["sku"],
+                update_fields=UPSERT_FIELDS,
+            )
+            transaction.on_commit(lambda: self.batch_committed(products, existing))
+
+    def resolve_categories(self, paths):
+        """
+        Fill `self.category_ids` for `paths`, creating missing categories.
+
+        Each segment is resolved under its parent, so `toys/phones` and
+        `electronics/phones` are different categories.
+        """
+        unknown = {path for path in paths if path and path not in self.category_ids}
+        if not unknown:
+            return
+
+        slugs = {slug for path in unknown for slug in path.split("/")}
+        by_parent = {
+            (parent_id, slug): pk
+            for pk, parent_id, slug in Category.objects.filter(slug__in=slugs).values_list("id", "parent_id", "slug")
+        }
+        for path in sorted(unknown):
+            parent_id = None
+            for slug in path.split("/"):
+                if (parent_id, slug) not in by_parent:
+                    category = Category.objects.create(
+                        slug=slug, name=slug.replace("-", " ").title(), parent_id=parent_id
+                    )
+                    by_parent[parent_id, slug] = category.pk
+                parent_id = by_parent[parent_id, slug]
+            self.category_ids[path] = parent_id
+
+    def batch_committed(self, products, existing):
+        product_ids = [product.pk for product in products if product.pk is not None]
+        tags = [f"product:{existing[product.sku][0]}" for product in products if product.sku in existing]
+        cache.invalidate_tags("category-tree", *tags)
+        catalog_batch_imported.send(sender=Product, product_ids=product_ids)
+
+
+def import_catalog(path, fmt=None, chunk_size=None, dry_run=False):
+    """Import the feed at `path`; return its `ImportStats`."""
+    importer = CatalogImporter(chunk_size=chunk_size, dry_run=dry_run)
+    with open(path, newline="", encoding="utf-8") as fh:
+        return importer.run(read_rows(fh, fmt or detect_format(path)))
@@ -0,0 +1,29 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from main.pincodes import build_index_from_csv
+
+
+class Command(BaseCommand):
+    help = (
+        "Build the memory-mapped PIN-code serviceability index from a CSV with "
+        "columns: pincode, district, state, zone, serviceable, cod. Running "
+        "workers pick up the new file within a second, without a restart."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("csv_path", help="Source dataset (CSV with a header row).")
+        parser.add_argument("--output", default=None,
+                            help="Index file to write (defaults to PINCODE_INDEX_PATH).")
+
+    def handle(self, *args, **options):
+        output = Path(options["output"] or settings.PINCODE_INDEX_PATH)
+        try:
+            count = build_index_from_csv(options["csv_path"], output)
+        except (OSError, ValueError) as exc:
+            raise CommandError(str(exc))
+        self.stdout.write(self.style.SUCCESS(
+            f"Indexed {count} PIN codes into {output} ({output.stat().st_size // 1024} KiB)."
+        ))
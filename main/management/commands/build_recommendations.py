@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from main.recommendations import build_recommendations
+
+
+class Command(BaseCommand):
+    help = (
+        "Fold new orders into the product co-occurrence matrix and refresh the "
+        "precomputed \"frequently bought together\" recommendations."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--full", action="store_true",
+                            help="Rebuild the matrix from the whole order history.")
+        parser.add_argument("--batch-size", type=int, default=None,
+                            help="Orders per batch (defaults to RECOMMENDATIONS_BATCH_SIZE).")
+        parser.add_argument("--top-k", type=int, default=None,
+                            help="Neighbours kept per product (defaults to RECOMMENDATIONS_TOP_K).")
+
+    def handle(self, *args, **options):
+        for name in ("batch_size", "top_k"):
+            if options[name] is not None and options[name] < 1:
+                raise CommandError(f"--{name.replace('_', '-')} must be at least 1.")
+
+        stats = build_recommendations(
+            full=options["full"], batch_size=options["batch_size"], top_k=options["top_k"]
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Processed {stats['orders']} orders ({stats['pairs']} pair updates); "
+            f"refreshed recommendations for {stats['products']} products."
+        ))
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from main.catalog_import import import_catalog
+
+
+class Command(BaseCommand):
+    help = (
+        "Stream a catalog feed (CSV or JSON Lines) into Product, upserting on SKU "
+        "and skipping rows whose content has not changed."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Feed file (.csv, or .jsonl / .ndjson).")
+        parser.add_argument("--format", choices=["csv", "jsonl"], default=None,
+                            help="Feed format (detected from the file extension by default).")
+        parser.add_argument("--chunk-size", type=int, default=None,
+                            help="Rows per batch (defaults to CATALOG_IMPORT_CHUNK_SIZE).")
+        parser.add_argument("--dry-run", action="store_true",
+                            help="Validate and diff the feed without writing anything.")
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] is not None and options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+        try:
+            stats = import_catalog(
+                options["path"],
+                fmt=options["format"],
+                chunk_size=options["chunk_size"],
+                dry_run=options["dry_run"],
+            )
+        except OSError as exc:
+            raise CommandError(str(exc))
+
+        for line, message in stats.errors:
+            self.stderr.write(f"Line {line}: {message}")
+        if stats.invalid > len(stats.errors):
+            self.stderr.write(f"... and {stats.invalid - len(stats.errors)} more invalid rows.")
+
+        prefix = "[dry run] " if options["dry_run"] else ""
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix}{stats.rows} rows in {stats.batches} batches, {stats.elapsed:.2f}s "
+            f"({stats.rows_per_second} rows/s): {stats.created} created, {stats.updated} updated, "
+            f"{stats.unchanged} unchanged, {stats.duplicates} duplicate, {stats.invalid} invalid."
+        ))
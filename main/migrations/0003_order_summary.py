@@ -0,0 +1,131 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:24
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def backfill_summaries(apps, schema_editor):
+    Order = apps.get_model("main", "Order")
+    OrderItem = apps.get_model("main", "OrderItem")
+    OrderSummary = apps.get_model("main", "OrderSummary")
+
+    order_ids = list(Order.objects.order_by("pk").values_list("pk", flat=True))
+    for start in range(0, len(order_ids), BACKFILL_BATCH_SIZE):
+        chunk = order_ids[start:start + BACKFILL_BATCH_SIZE]
+        counts, first_items = {}, {}
+        for item in (
+            OrderItem.objects.filter(order_id__in=chunk)
+            .select_related("product")
+            .order_by("order_id", "pk")
+        ):
+            counts[item.order_id] = counts.get(item.order_id, 0) + item.quantity
+            first_items.setdefault(item.order_id, item.product)
+
+        OrderSummary.objects.bulk_create([
+            OrderSummary(
+                order_id=order.pk,
+                user_id=order.user_id,
+                status=order.status,
+                item_count=counts.get(order.pk, 0),
+                total=order.total,
+                first_item_name=first_items[order.pk].name if order.pk in first_items else "",
+                first_item_thumbnail=first_items[order.pk].image_url if order.pk in first_items else "",
+                created_at=order.created_at,
+            )
+            for order in Order.objects.filter(pk__in=chunk)
+        ])
+
+
+# On PostgreSQL the listing index also carries the summary columns, so the
+# "my orders" page is an index-only scan. `Index(include=...)` would warn on
+# SQLite (models.W040), hence the same-named index is rebuilt here instead.
+COVERING_INDEX = (
+    'CREATE INDEX "order_summary_user_recent_idx" ON "main_ordersummary" '
+    '("user_id", "created_at" DESC, "order_id" DESC) '
+    'INCLUDE ("status", "item_count", "total", "first_item_name", "first_item_thumbnail")'
+)
+PLAIN_INDEX = (
+    'CREATE INDEX "order_summary_user_recent_idx" ON "main_ordersummary" '
+    '("user_id", "created_at" DESC, "order_id" DESC)'
+)
+
+
+def create_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS "order_summary_user_recent_idx"')
+    schema_editor.execute(COVERING_INDEX)
+
+
+def drop_covering_index(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute('DROP INDEX IF EXISTS "order_summary_user_recent_idx"')
+    schema_editor.execute(PLAIN_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0002_orders_recommendations"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OrderSummary",
+            fields=[
+                (
+                    "order",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="summary",
+                        serialize=False,
+                        to="main.order",
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("paid", "Paid"),
+                            ("shipped", "Shipped"),
+                            ("delivered", "Delivered"),
+                            ("cancelled", "Cancelled"),
+                        ],
+                        max_length=20,
+                    ),
+                ),
+                ("item_count", models.PositiveIntegerField()),
+                ("total", models.DecimalField(decimal_places=2, max_digits=12)),
+                ("first_item_name", models.CharField(blank=True, max_length=255)),
+                ("first_item_thumbnail", models.URLField(blank=True, max_length=500)),
+                ("created_at", models.DateTimeField()),
+                (
+                    "user",
+                    models.ForeignKey(
+                        db_index=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["user", "-created_at", "-order"],
+                        name="order_summary_user_recent_idx",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(create_covering_index, drop_covering_index),
+        migrations.RunPython(backfill_summaries, migrations.RunPython.noop),
+    ]
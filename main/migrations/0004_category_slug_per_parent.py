@@ -0,0 +1,32 @@
+# Generated by Django 5.2.5 on 2026-10-19 16:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("main", "0003_order_summary"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="category",
+            name="slug",
+            field=models.SlugField(max_length=100),
+        ),
+        migrations.AddConstraint(
+            model_name="category",
+            constraint=models.UniqueConstraint(
+                fields=("parent", "slug"), name="category_parent_slug_unique"
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="category",
+            constraint=models.UniqueConstraint(
+                condition=models.Q(("parent__isnull", True)),
+                fields=("slug",),
+                name="category_root_slug_unique",
+            ),
+        ),
+    ]
@@ -0,0 +1,219 @@
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+
+
+# -------------------------------------------------------------------
+# Catalog
+# -------------------------------------------------------------------
+
+class Category(models.Model):
+    """Product category; categories form a tree through `parent`, slugs are unique per parent."""
+
+    name   = models.CharField(max_length=100)
+    slug   = models.SlugField(max_length=100)
+    parent = models.ForeignKey(
+        "self", null=True, blank=True, related_name="children", on_delete=models.CASCADE
+    )
+
+    # Tracking
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        verbose_name_plural = "categories"
+        constraints = [
+            models.UniqueConstraint(fields=["parent", "slug"], name="category_parent_slug_unique"),
+            # NULLs are distinct in unique constraints, so root slugs need their own
+            models.UniqueConstraint(
+                fields=["slug"], condition=models.Q(parent__isnull=True), name="category_root_slug_unique"
+            ),
+        ]
+
+    def __str__(self):
+        return self.name
+
+
+class ProductQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        """Writes outside the importer invalidate `content_hash` (see Product.save)."""
+        kwargs.setdefault("content_hash", "")
+        return super().update(**kwargs)
+
+
+class Product(models.Model):
+    """A sellable item, identified by its merchant SKU."""
+
+    # Identity
+    sku  = models.CharField(max_length=64, unique=True)
+    name = models.CharField(max_length=255)
+
+    # Details
+    description = models.TextField(blank=True)
+    price       = models.DecimalField(max_digits=10, decimal_places=2)
+    stock       = models.PositiveIntegerField(default=0)
+    category    = models.ForeignKey(
+        Category, null=True, blank=True, related_name="products", on_delete=models.SET_NULL
+    )
+    image_url   = models.URLField(max_length=500, blank=True)
+    is_active   = models.BooleanField(default=True)
+
+    # Hash of the imported feed row; lets imports skip unchanged products.
+    # Only valid while the row still holds exactly what the feed sent, so any
+    # other write clears it (save(), QuerySet.update(), place_order).
+    content_hash = models.CharField(max_length=64, blank=True, editable=False)
+
+    # Tracking
+    created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = ProductQuerySet.as_manager()
+
+    def save(self, *args, **kwargs):
+        self.content_hash = ""
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "content_hash"}
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return f"{self.name} ({self.sku})"
+
+
+# -------------------------------------------------------------------
+# Orders
+# -------------------------------------------------------------------
+
+class OrderQuerySet(models.QuerySet):
+    def update(self, **kwargs):
+        """Also copy `status` / `total` to the order summaries (update() skips post_save)."""
+        synced = [name for name in ("status", "total") if name in kwargs]
+        if not synced:
+            return super().update(**kwargs)
+
+        with transaction.atomic(using=self.db):
+            order_ids = list(self.values_list("pk", flat=True))
+            rows = super().update(**kwargs)
+            OrderSummary.objects.filter(order_id__in=order_ids).update(**{
+                name: Subquery(Order.objects.filter(pk=OuterRef("order_id")).values(name)[:1])
+                for name in synced
+            })
+        return rows
+
+
+class Order(models.Model):
+    """A placed order; its lines are `OrderItem`s."""
+
+    STATUS_PENDING = "pending"
+    STATUS_PAID = "paid"
+    STATUS_SHIPPED = "shipped"
+    STATUS_DELIVERED = "delivered"
+    STATUS_CANCELLED = "cancelled"
+    STATUS_CHOICES = [
+        (STATUS_PENDING, "Pending"),
+        (STATUS_PAID, "Paid"),
+        (STATUS_SHIPPED, "Shipped"),
+        (STATUS_DELIVERED, "Delivered"),
+        (STATUS_CANCELLED, "Cancelled"),
+    ]
+
+    user   = models.ForeignKey(settings.AUTH_USER_MODEL, related_name="orders", on_delete=models.CASCADE)
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_PENDING)
+    total  = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    # Tracking
+    created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = OrderQuerySet.as_manager()
+
+    def __str__(self):
+        return f"Order #{self.pk} ({self.status})"
+
+
+class OrderItem(models.Model):
+    """One product line of an order, priced at the time of purchase."""
+
+    order      = models.ForeignKey(Order, related_name="items", on_delete=models.CASCADE)
+    product    = models.ForeignKey(Product, related_name="order_items", on_delete=models.PROTECT)
+    quantity   = models.PositiveIntegerField(default=1)
+    unit_price = models.DecimalField(max_digits=10, decimal_places=2)
+
+    def __str__(self):
+        return f"{self.quantity} x {self.product_id}"
+
+
+# -------------------------------------------------------------------
+# Recommendations (built by main.recommendations)
+# -------------------------------------------------------------------
+
+class ProductPairCount(models.Model):
+    """
+    Sparse, symmetric item co-occurrence matrix: the number of orders that
+    contain both products. Only `product_a <= product_b` is stored, and the
+    diagonal (`product_a == product_b`) holds each product's order count.
+    """
+
+    product_a = models.ForeignKey(Product, related_name="+", on_delete=models.CASCADE)
+    product_b = models.ForeignKey(Product, related_name="+", on_delete=models.CASCADE)
+    count     = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["product_a", "product_b"], name="product_pair_unique"),
+        ]
+        indexes = [models.Index(fields=["product_b"], name="product_pair_b_idx")]
+
+
+class ProductRecommendation(models.Model):
+    """Precomputed top-K "frequently bought together" neighbours of a product."""
+
+    product     = models.ForeignKey(Product, related_name="recommendations", on_delete=models.CASCADE)
+    recommended = models.ForeignKey(Product, related_name="+", on_delete=models.CASCADE)
+    rank        = models.PositiveSmallIntegerField()
+    score       = models.FloatField()
+
+    class Meta:
+        ordering = ["product", "rank"]
+        constraints = [
+            models.UniqueConstraint(fields=["product", "rank"], name="product_recommendation_rank_unique"),
+        ]
+
+
+class RecommendationState(models.Model):
+    """Single-row watermark: the last order folded into `ProductPairCount`."""
+
+    last_order_id = models.BigIntegerField(default=0)
+    updated_at    = models.DateTimeField(auto_now=True)
+
+
+class OrderSummary(models.Model):
+    """
+    Denormalised listing row of an order, written by `main.services.place_order`.
+
+    The "my orders" page reads only this table: one index range scan on
+    `(user, -created_at, -order)` instead of joining items and products and
+    aggregating per order. Order and item saves rebuild it
+    (`main.signals.sync_order_summary`), and `Order.objects...update()`
+    copies `status` / `total`.
+    """
+
+    order  = models.OneToOneField(Order, primary_key=True, related_name="summary", on_delete=models.CASCADE)
+    user   = models.ForeignKey(settings.AUTH_USER_MODEL, related_name="+", db_index=False, on_delete=models.CASCADE)
+    status = models.CharField(max_length=20, choices=Order.STATUS_CHOICES)
+
+    # Aggregates
+    item_count = models.PositiveIntegerField()
+    total      = models.DecimalField(max_digits=12, decimal_places=2)
+
+    # First line, for the listing thumbnail
+    first_item_name      = models.CharField(max_length=255, blank=True)
+    first_item_thumbnail = models.URLField(max_length=500, blank=True)
+
+    # Copied from the order (the pagination key)
+    created_at = models.DateTimeField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "-created_at", "-order"], name="order_summary_user_recent_idx"),
+        ]
@@ -0,0 +1,225 @@
+"""
+PIN-code serviceability index.
+
+Indian PIN codes are six digits and never start with 0, so every possible code
+maps to a fixed slot in a direct-address table. The index file is built by
+`manage.py build_pincode_index` and memory-mapped at runtime: a lookup is one
+offset computation and a 4-byte read, with no database access, and only the
+pages actually touched are loaded into memory. A rebuilt file is picked up
+without a restart: `get_index()` re-stats the path at most every
+`RELOAD_CHECK_INTERVAL` seconds and remaps it when its inode or mtime changed.
+
+File layout (little-endian):
+
+    b"PINX" | version u8 | 3 pad bytes | header length u32 | header JSON
+    | 900,000 records of 4 bytes (PIN 100000 .. 999999)
+
+Record: district index u16 (0 = PIN not in dataset, otherwise index + 1),
+state index u8, flags u8 (bit 0 serviceable, bit 1 COD, bits 2-7 zone index).
+"""
+import csv
+import json
+import mmap
+import os
+import re
+import struct
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from django.conf import settings
+
+
+MAGIC = b"PINX"
+VERSION = 1
+FIRST_PIN = 100000
+LAST_PIN = 999999
+SLOTS = LAST_PIN - FIRST_PIN + 1
+PREAMBLE = struct.Struct("<4sB3xI")
+RECORD = struct.Struct("<HBB")
+
+PIN_RE = re.compile(r"^[1-9][0-9]{5}$")
+TRUE_VALUES = {"1", "true", "yes", "y"}
+
+MAX_DISTRICTS = 0xFFFF - 1
+MAX_STATES = 0xFF
+MAX_ZONES = 0x3F
+
+RELOAD_CHECK_INTERVAL = 1.0  # seconds between checks for a rebuilt index file
+
+
+@dataclass(frozen=True)
+class PinInfo:
+    pin_code: str
+    district: str
+    state: str
+    zone: str
+    serviceable: bool
+    cod: bool
+
+    def as_dict(self):
+        return asdict(self)
+
+
+def is_valid_format(pin_code):
+    return isinstance(pin_code, str) and bool(PIN_RE.match(pin_code))
+
+
+# -------------------------------------------------------------------
+# Building
+# -------------------------------------------------------------------
+
+def build_index(rows, output_path):
+    """
+    Write an index file from dict rows with keys
+    `pincode, district, state, zone, serviceable, cod`.
+
+    Returns the number of PIN codes written. Raises ValueError on bad input.
+    """
+    table = bytearray(SLOTS * RECORD.size)
+    districts, states, zones = {}, {}, {}
+    count = 0
+
+    def intern(mapping, value, limit, label):
+        if value not in mapping:
+            if len(mapping) >= limit:
+                raise ValueError(f"Too many distinct {label} values (max {limit}).")
+            mapping[value] = len(mapping)
+        return mapping[value]
+
+    for line, row in enumerate(rows, start=2):
+        pin = (row.get("pincode") or "").strip()
+        if not is_valid_format(pin):
+            raise ValueError(f"Line {line}: invalid PIN code {pin!r}.")
+        district = intern(districts, (row.get("district") or "").strip(), MAX_DISTRICTS, "district")
+        state = intern(states, (row.get("state") or "").strip(), MAX_STATES, "state")
+        zone = intern(zones, (row.get("zone") or "").strip(), MAX_ZONES + 1, "zone")
+        flags = (zone << 2)
+        if (row.get("serviceable") or "").strip().lower() in TRUE_VALUES:
+            flags |= 1
+        if (row.get("cod") or "").strip().lower() in TRUE_VALUES:
+            flags |= 2
+
+        offset = (int(pin) - FIRST_PIN) * RECORD.size
+        if table[offset:offset + 2] == b"\0\0":
+            count += 1
+        RECORD.pack_into(table, offset, district + 1, state, flags)
+
+    header = json.dumps({
+        "districts": list(districts),
+        "states": list(states),
+        "zones": list(zones),
+        "count": count,
+    }).encode()
+
+    output_path = Path(output_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = output_path.with_suffix(output_path.suffix + ".tmp")
+    with open(tmp_path, "wb") as fh:
+        fh.write(PREAMBLE.pack(MAGIC, VERSION, len(header)))
+        fh.write(header)
+        fh.write(table)
+    tmp_path.replace(output_path)  # atomic swap: workers remap it on their next check
+    return count
+
+
+def build_index_from_csv(csv_path, output_path):
+    with open(csv_path, newline="", encoding="utf-8") as fh:
+        return build_index(csv.DictReader(fh), output_path)
+
+
+# -------------------------------------------------------------------
+# Lookups
+# -------------------------------------------------------------------
+
+def file_identity(stat):
+    """What changes when `build_index` swaps in a new file."""
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class PincodeIndex:
+    """Read-only view over a memory-mapped index file."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with open(self.path, "rb") as fh:
+            self.identity = file_identity(os.fstat(fh.fileno()))
+            self.map = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, header_length = PREAMBLE.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{self.path} is not a PIN-code index (version {VERSION}).")
+        header = json.loads(self.map[PREAMBLE.size:PREAMBLE.size + header_length])
+        self.districts = header["districts"]
+        self.states = header["states"]
+        self.zones = header["zones"]
+        self.count = header["count"]
+        self.table_offset = PREAMBLE.size + header_length
+
+        if len(self.map) != self.table_offset + SLOTS * RECORD.size:
+            raise ValueError(f"{self.path} is truncated.")
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, pin_code):
+        return self.lookup(pin_code) is not None
+
+    def lookup(self, pin_code):
+        """Return a `PinInfo`, or None if the code is malformed or not in the dataset."""
+        if not is_valid_format(pin_code):
+            return None
+        offset = self.table_offset + (int(pin_code) - FIRST_PIN) * RECORD.size
+        district, state, flags = RECORD.unpack_from(self.map, offset)
+        if district == 0:
+            return None
+        return PinInfo(
+            pin_code=pin_code,
+            district=self.districts[district - 1],
+            state=self.states[state],
+            zone=self.zones[flags >> 2],
+            serviceable=bool(flags & 1),
+            cod=bool(flags & 2),
+        )
+
+    def close(self):
+        self.map.close()
+
+
+_index = None
+_index_lock = threading.Lock()
+_checked_at = 0.0
+
+
+def get_index():
+    """
+    The process-wide index, opened on first use and reopened after a rebuild.
+
+    Returns None when `PINCODE_INDEX_PATH` does not exist (e.g. local
+    development without a dataset); callers then fall back to format checks.
+    A replaced mapping is not closed, as other threads may still be reading
+    it; it is released once the last reference goes.
+    """
+    global _index, _checked_at
+    if _index is not None and time.monotonic() - _checked_at < RELOAD_CHECK_INTERVAL:
+        return _index
+    with _index_lock:
+        _checked_at = time.monotonic()
+        path = Path(settings.PINCODE_INDEX_PATH)
+        try:
+            identity = file_identity(path.stat())
+        except FileNotFoundError:
+            return _index  # keep serving a mapping whose file was removed
+        if _index is None or _index.path != path or _index.identity != identity:
+            _index = PincodeIndex(path)
+    return _index
+
+
+def reset_index():
+    """Forget the open index (after a rebuild, or between tests)."""
+    global _index
+    with _index_lock:
+        if _index is not None:
+            _index.close()
+        _index = None
@@ -0,0 +1,233 @@
+"""
+"Frequently bought together" recommendations.
+
+`manage.py build_recommendations` runs the offline pipeline:
+
+1. Orders past the `RecommendationState` watermark (a max pk) and older than
+   `RECOMMENDATIONS_ORDER_LAG` are folded into the
+   sparse co-occurrence matrix `ProductPairCount` (each product counts once
+   per order; cancelled orders are skipped, and a cancellation after an
+   order was folded in is only reflected by a `--full` rebuild).
+2. Every product that appeared in those orders is re-scored against its
+   neighbours with cosine similarity, `C[a,b] / sqrt(C[a,a] * C[b,b])`, and its
+   top K neighbours replace its `ProductRecommendation` rows.
+3. Cached recommendation responses of the re-scored products are invalidated.
+
+Work is done in batches of orders and products, so memory is bounded by the
+batch, not by the order history. Each order batch commits with the watermark
+and each re-scoring chunk in its own transaction, so no lock is held for the
+whole run; if a run dies between the two, the lists of the products it folded
+are refreshed when they next appear in an order or by a `--full` rebuild. Incremental runs only re-score products from
+new orders; the lists of their neighbours pick up the (small) drift of the
+diagonal at the next `--full` rebuild.
+
+Primary keys are assigned at INSERT but become visible at COMMIT, so a
+slow transaction can commit a lower pk after a higher one was folded. The
+lag keeps the watermark behind every transaction that may still be open:
+folding stops at the first order (in pk order) younger than the lag, so the
+watermark never passes an order that might not have committed yet.
+"""
+import heapq
+import math
+from collections import Counter, defaultdict
+from datetime import timedelta
+from itertools import takewhile
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from core.caching import cache
+from .models import Order, OrderItem, ProductPairCount, ProductRecommendation, RecommendationState
+
+
+SCORE_CHUNK_SIZE = 500
+
+
+def recommendations_tag(product_id):
+    return f"recommendations:{product_id}"
+
+
+def dependent_tags(product_ids):
+    """
+    Tags of the cached lists that show any of `product_ids`.
+
+    Served lists embed the recommended products' name, price and image and
+    hide inactive ones, so a change to any of them must drop the list.
+    """
+    product_ids = list(product_ids)
+    if not product_ids:
+        return []
+    shown_on = (
+        ProductRecommendation.objects.filter(recommended_id__in=product_ids)
+        .values_list("product_id", flat=True)
+        .distinct()
+    )
+    return [recommendations_tag(product_id) for product_id in shown_on]
+
+
+def invalidate_imported(sender, product_ids, **kwargs):
+    """`catalog_batch_imported` receiver (bulk upserts skip post_save)."""
+    cache.invalidate_tags(*dependent_tags(product_ids))
+
+
+# -------------------------------------------------------------------
+# Co-occurrence matrix
+# -------------------------------------------------------------------
+
+def order_baskets(order_ids):
+    """Distinct product ids of each order, as a list of sets."""
+    baskets = defaultdict(set)
+    for order_id, product_id in OrderItem.objects.filter(order_id__in=order_ids).values_list(
+        "order_id", "product_id"
+    ):
+        baskets[order_id].add(product_id)
+    return list(baskets.values())
+
+
+def count_pairs(baskets):
+    """Upper-triangular pair counts (diagonal included) of a batch of baskets."""
+    pairs = Counter()
+    for basket in baskets:
+        products = sorted(basket)
+        for i, a in enumerate(products):
+            for b in products[i:]:
+                pairs[a, b] += 1
+    return pairs
+
+
+def apply_pair_counts(pairs):
+    """Add a batch's pair counts to `ProductPairCount`."""
+    if not pairs:
+        return
+    existing = {
+        (row.product_a_id, row.product_b_id): row
+        for row in ProductPairCount.objects.filter(
+            product_a_id__in={a for a, _ in pairs}, product_b_id__in={b for _, b in pairs}
+        )
+    }
+    to_update, to_create = [], []
+    for (a, b), count in pairs.items():
+        row = existing.get((a, b))
+        if row is None:
+            to_create.append(ProductPairCount(product_a_id=a, product_b_id=b, count=count))
+        else:
+            row.count += count
+            to_update.append(row)
+    ProductPairCount.objects.bulk_update(to_update, ["count"], batch_size=SCORE_CHUNK_SIZE)
+    ProductPairCount.objects.bulk_create(to_create, batch_size=SCORE_CHUNK_SIZE)
+
+
+# -------------------------------------------------------------------
+# Scoring
+# -------------------------------------------------------------------
+
+def top_neighbours(product_ids, top_k):
+    """`{product_id: [(neighbour_id, score), ...]}`, best first, for `product_ids`."""
+    wanted = set(product_ids)
+    neighbours = {product_id: {} for product_id in wanted}
+    diagonal = {}
+    for a, b, count in ProductPairCount.objects.filter(
+        Q(product_a_id__in=wanted) | Q(product_b_id__in=wanted)
+    ).values_list("product_a_id", "product_b_id", "count"):
+        if a == b:
+            diagonal[a] = count
+            continue
+        if a in wanted:
+            neighbours[a][b] = count
+        if b in wanted:
+            neighbours[b][a] = count
+
+    missing = {n for row in neighbours.values() for n in row} - diagonal.keys()
+    diagonal.update(
+        ProductPairCount.objects.filter(product_a_id__in=missing, product_b_id=F("product_a_id"))
+        .values_list("product_a_id", "count")
+    )
+
+    result = {}
+    for product_id, row in neighbours.items():
+        scored = (
+            (count / math.sqrt(diagonal[product_id] * diagonal[n]), count, -n)
+            for n, count in row.items()
+        )
+        result[product_id] = [(-n, score) for score, _, n in heapq.nlargest(top_k, scored)]
+    return result
+
+
+def write_recommendations(neighbours):
+    ProductRecommendation.objects.filter(product_id__in=list(neighbours)).delete()
+    ProductRecommendation.objects.bulk_create(
+        [
+            ProductRecommendation(product_id=product_id, recommended_id=n, rank=rank, score=score)
+            for product_id, ranked in neighbours.items()
+            for rank, (n, score) in enumerate(ranked, start=1)
+        ],
+        batch_size=SCORE_CHUNK_SIZE,
+    )
+
+
+# -------------------------------------------------------------------
+# Pipeline
+# -------------------------------------------------------------------
+
+def build_recommendations(full=False, batch_size=None, top_k=None):
+    """
+    Fold new orders into the matrix and refresh affected recommendations.
+
+    With `full=True` the matrix is rebuilt from the whole order history; the
+    current lists keep being served until their products are re-scored.
+    Each batch of orders is committed together with the watermark, which is
+    locked per batch so concurrent runs never fold an order twice. Products
+    are then re-scored in transactions of their own. Returns counts of
+    processed orders, pairs and products.
+    """
+    batch_size = batch_size or getattr(settings, "RECOMMENDATIONS_BATCH_SIZE", 1000)
+    top_k = top_k or getattr(settings, "RECOMMENDATIONS_TOP_K", 10)
+    cutoff = timezone.now() - getattr(settings, "RECOMMENDATIONS_ORDER_LAG", timedelta(minutes=10))
+    stats = {"orders": 0, "pairs": 0, "products": 0}
+
+    stale = set()
+    if full:
+        with transaction.atomic():
+            state, _ = RecommendationState.objects.select_for_update().get_or_create(pk=1)
+            stale.update(ProductRecommendation.objects.values_list("product_id", flat=True).distinct())
+            ProductPairCount.objects.all().delete()
+            state.last_order_id = 0
+            state.save()
+
+    touched = set()
+    while True:
+        with transaction.atomic():
+            state, _ = RecommendationState.objects.select_for_update().get_or_create(pk=1)
+            candidates = list(
+                Order.objects.filter(pk__gt=state.last_order_id)
+                .order_by("pk")
+                .values_list("pk", "status", "created_at")[:batch_size]
+            )
+            orders = list(takewhile(lambda order: order[2] < cutoff, candidates))
+            if not orders:
+                break
+            baskets = order_baskets(
+                [pk for pk, status, _ in orders if status != Order.STATUS_CANCELLED]
+            )
+            pairs = count_pairs(baskets)
+            apply_pair_counts(pairs)
+            state.last_order_id = orders[-1][0]
+            state.save()
+        touched.update(product_id for basket in baskets for product_id in basket)
+        stats["orders"] += len(orders)
+        stats["pairs"] += len(pairs)
+        if len(orders) < len(candidates):
+            break  # reached orders inside the lag window
+
+    # Stale products without neighbours any more get their lists deleted
+    ordered = sorted(stale | touched)
+    for start in range(0, len(ordered), SCORE_CHUNK_SIZE):
+        chunk = ordered[start:start + SCORE_CHUNK_SIZE]
+        with transaction.atomic():
+            write_recommendations(top_neighbours(chunk, top_k))
+            tags = [recommendations_tag(product_id) for product_id in chunk]
+            transaction.on_commit(lambda tags=tags: cache.invalidate_tags(*tags))
+    stats["products"] = len(touched)
+    return stats
@@ -0,0 +1,67 @@
+from django.conf import settings
+from rest_framework import serializers
+
+from .models import OrderSummary, ProductRecommendation
+
+
+class PincodeCheckSerializer(serializers.Serializer):
+    """
+    Batch PIN-code check input
+
+    - Accepts a list of PIN codes (capped by `PINCODE_CHECK_MAX`).
+    """
+    pin_codes = serializers.ListField(child=serializers.CharField(max_length=6), allow_empty=False)
+
+    def validate_pin_codes(self, value):
+        limit = getattr(settings, "PINCODE_CHECK_MAX", 500)
+        if len(value) > limit:
+            raise serializers.ValidationError(f"At most {limit} PIN codes can be checked at once.")
+        return value
+
+
+class ProductRecommendationSerializer(serializers.ModelSerializer):
+    """
+    One "frequently bought together" entry
+
+    - Flattens the recommended product's listing fields next to its score.
+    """
+    id        = serializers.IntegerField(source="recommended.id")
+    sku       = serializers.CharField(source="recommended.sku")
+    name      = serializers.CharField(source="recommended.name")
+    price     = serializers.DecimalField(source="recommended.price", max_digits=10, decimal_places=2)
+    image_url = serializers.CharField(source="recommended.image_url")
+
+    class Meta:
+        model = ProductRecommendation
+        fields = ["id", "sku", "name", "price", "image_url", "score"]
+
+
+class OrderLineSerializer(serializers.Serializer):
+    product_id = serializers.IntegerField(min_value=1)
+    quantity   = serializers.IntegerField(min_value=1, max_value=1000)
+
+
+class OrderCreateSerializer(serializers.Serializer):
+    """
+    Order placement input
+
+    - A list of `{product_id, quantity}` lines; availability and stock are
+      checked by `main.services.place_order`.
+    """
+    items = OrderLineSerializer(many=True, allow_empty=False)
+
+
+class OrderSummarySerializer(serializers.ModelSerializer):
+    """
+    "My orders" listing row
+
+    - Built only from the denormalised `OrderSummary` table.
+    """
+    id = serializers.IntegerField(source="order_id")
+
+    class Meta:
+        model = OrderSummary
+        fields = [
+            "id", "status", "item_count", "total",
+            "first_item_name", "first_item_thumbnail", "created_at",
+        ]
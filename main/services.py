@@ -0,0 +1,96 @@
+"""
+Order placement.
+
+Views call `place_order`, which writes the order, its items and its
+`OrderSummary` in one transaction. Later changes to an order or its items
+go through `refresh_order_summaries`.
+"""
+from collections import Counter
+
+from django.db import transaction
+
+from core.caching import cache
+from .models import Order, OrderItem, OrderSummary, Product
+
+
+class OrderError(ValueError):
+    pass
+
+
+@transaction.atomic
+def place_order(user, lines):
+    """
+    Create an order for `user` from `(product_id, quantity)` pairs.
+
+    Products are locked and their stock decremented in the same transaction.
+    Raises OrderError for unknown or inactive products and insufficient stock.
+    """
+    quantities = Counter()
+    for product_id, quantity in lines:
+        quantities[product_id] += quantity
+    if not quantities:
+        raise OrderError("An order needs at least one item.")
+
+    # Lock in pk order: concurrent orders with overlapping products must not deadlock
+    products = Product.objects.select_for_update().order_by("pk").in_bulk(list(quantities))
+    for product_id, quantity in quantities.items():
+        product = products.get(product_id)
+        if product is None or not product.is_active:
+            raise OrderError(f"Product {product_id} is not available.")
+        if product.stock < quantity:
+            raise OrderError(f"Only {product.stock} of {product.sku} left in stock.")
+
+    total = sum(products[product_id].price * quantity for product_id, quantity in quantities.items())
+    order = Order.objects.create(user=user, total=total)
+    OrderItem.objects.bulk_create([
+        OrderItem(order=order, product_id=product_id, quantity=quantity, unit_price=products[product_id].price)
+        for product_id, quantity in quantities.items()
+    ])
+
+    for product_id, quantity in quantities.items():
+        products[product_id].stock -= quantity
+        products[product_id].content_hash = ""  # stock no longer matches the feed
+    Product.objects.bulk_update(products.values(), ["stock", "content_hash"])
+
+    first = products[next(iter(quantities))]
+    OrderSummary.objects.create(
+        order=order,
+        user=user,
+        status=order.status,
+        item_count=sum(quantities.values()),
+        total=total,
+        first_item_name=first.name,
+        first_item_thumbnail=first.image_url,
+        created_at=order.created_at,
+    )
+
+    # bulk_update skips post_save, so invalidate the product caches here
+    tags = [f"product:{product_id}" for product_id in quantities]
+    transaction.on_commit(lambda: cache.invalidate_tags(*tags))
+    return order
+
+
+def refresh_order_summaries(order_ids):
+    """
+    Rebuild the existing summaries of `order_ids` from their orders and items.
+
+    Only updates: an order without a summary (being placed, or being deleted
+    with its summary) is left alone.
+    """
+    orders = Order.objects.filter(pk__in=order_ids, summary__isnull=False)
+    items = {}
+    for item in (
+        OrderItem.objects.filter(order_id__in=order_ids).select_related("product").order_by("order_id", "pk")
+    ):
+        items.setdefault(item.order_id, []).append(item)
+
+    for order in orders:
+        lines = items.get(order.pk, [])
+        first = lines[0].product if lines else None
+        OrderSummary.objects.filter(order_id=order.pk).update(
+            status=order.status,
+            total=order.total,
+            item_count=sum(line.quantity for line in lines),
+            first_item_name=first.name if first else "",
+            first_item_thumbnail=first.image_url if first else "",
+        )
@@ -0,0 +1,26 @@
+from django.dispatch import Signal
+
+from .models import Order
+from .services import refresh_order_summaries
+
+
+# Sent once per imported batch by main.catalog_import (bulk upserts bypass
+# post_save). Receivers get `product_ids`: the created or updated products.
+# Search indexers and other derived stores should hook in here.
+catalog_batch_imported = Signal()
+
+
+def sync_order_summary(sender, instance, created=False, **kwargs):
+    """
+    Rebuild an order's `OrderSummary` after the order or one of its items
+    is saved or deleted (connected in MainConfig.ready).
+
+    A newly created order has no summary yet: `place_order` writes it.
+    """
+    if sender is Order:
+        if created:
+            return
+        order_id = instance.pk
+    else:
+        order_id = instance.order_id
+    refresh_order_summaries([order_id])
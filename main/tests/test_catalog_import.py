@@ -0,0 +1,144 @@
+import json
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+
+from core.caching import cache
+from main.catalog_import import CatalogImporter, RowError, clean_row, read_rows
+from main.models import Category, Product
+from main.services import place_order
+from main.signals import catalog_batch_imported
+
+
+FEED = """sku,name,price,stock,category,image_url,is_active
+SKU-1,Phone,199.99,5,electronics/phones,https://img.example.com/1.png,yes
+SKU-2,Cable,4.5,100,electronics/cables,,yes
+SKU-3,Broken,not-a-price,1,,,yes
+SKU-4,Lamp,25,2,home,,no
+"""
+
+
+@pytest.fixture
+def feed(tmp_path):
+    path = tmp_path / "catalog.csv"
+    path.write_text(FEED)
+    return path
+
+
+def run_import(rows, **kwargs):
+    return CatalogImporter(**kwargs).run(enumerate(rows, start=1))
+
+
+@pytest.mark.django_db
+def test_command_imports_feed_and_reports_throughput(feed, capsys, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("import_catalog", str(feed), "--chunk-size", "2")
+    out, err = capsys.readouterr()
+
+    assert "4 rows in 2 batches" in out and "rows/s" in out
+    assert "3 created, 0 updated, 0 unchanged, 0 duplicate, 1 invalid" in out
+    assert "Line 4: SKU-3: invalid price" in err
+
+    phone = Product.objects.select_related("category__parent").get(sku="SKU-1")
+    assert phone.price == Decimal("199.99") and phone.stock == 5
+    assert (phone.category.slug, phone.category.parent.slug) == ("phones", "electronics")
+    assert Category.objects.filter(slug="electronics").count() == 1
+    assert not Product.objects.get(sku="SKU-4").is_active
+
+
+@pytest.mark.django_db
+def test_reimport_skips_unchanged_rows_and_upserts_changed_ones(django_capture_on_commit_callbacks):
+    rows = [
+        {"sku": "A", "name": "Alpha", "price": "10"},
+        {"sku": "B", "name": "Beta", "price": "20"},
+    ]
+    with django_capture_on_commit_callbacks(execute=True):
+        run_import(rows)
+    alpha = Product.objects.get(sku="A")
+    cache.set("product-page", "cached", tags=[f"product:{alpha.pk}"])
+
+    received = []
+    def receiver(sender, product_ids, **kwargs):
+        received.append(product_ids)
+    catalog_batch_imported.connect(receiver)
+    try:
+        rows[0]["price"] = "12.50"
+        with django_capture_on_commit_callbacks(execute=True):
+            stats = run_import(rows)
+    finally:
+        catalog_batch_imported.disconnect(receiver)
+
+    assert (stats.created, stats.updated, stats.unchanged) == (0, 1, 1)
+    assert Product.objects.get(sku="A").price == Decimal("12.50")
+    assert Product.objects.get(sku="A").pk == alpha.pk
+    assert received == [[alpha.pk]]
+    assert cache.get("product-page") is None
+
+
+@pytest.mark.django_db
+def test_reimport_restores_products_changed_outside_the_importer(django_user_model):
+    rows = [
+        {"sku": "A", "name": "Alpha", "price": "10", "stock": "5"},
+        {"sku": "B", "name": "Beta", "price": "20", "stock": "5"},
+        {"sku": "C", "name": "Gamma", "price": "30", "stock": "5"},
+    ]
+    run_import(rows)
+    user = django_user_model.objects.create_user(email="buyer@example.com", password="secret123")
+    place_order(user, [(Product.objects.get(sku="A").pk, 2)])
+    beta = Product.objects.get(sku="B")
+    beta.name = "Edited in admin"
+    beta.save()
+    Product.objects.filter(sku="C").update(is_active=False)
+
+    stats = run_import(rows)
+
+    assert (stats.updated, stats.unchanged) == (3, 0)
+    assert dict(Product.objects.values_list("sku", "stock")) == {"A": 5, "B": 5, "C": 5}
+    assert Product.objects.get(sku="B").name == "Beta"
+    assert Product.objects.get(sku="C").is_active
+
+
+@pytest.mark.django_db
+def test_sku_repeated_within_a_chunk_is_counted_as_duplicate():
+    stats = run_import([
+        {"sku": "A", "name": "Alpha", "price": "10"},
+        {"sku": "A", "name": "Alpha v2", "price": "11"},
+    ])
+
+    assert (stats.created, stats.unchanged, stats.duplicates) == (1, 0, 1)
+    assert Product.objects.get(sku="A").name == "Alpha v2"
+
+
+@pytest.mark.django_db
+def test_dry_run_writes_nothing():
+    stats = run_import([{"sku": "A", "name": "Alpha", "price": "10", "category": "toys"}], dry_run=True)
+
+    assert stats.created == 1
+    assert not Product.objects.exists() and not Category.objects.exists()
+
+
+def test_jsonl_reader_flags_malformed_lines(tmp_path):
+    path = tmp_path / "catalog.jsonl"
+    path.write_text(json.dumps({"sku": "A"}) + "\n\n{oops\n[1]\n")
+
+    with open(path) as fh:
+        assert list(read_rows(fh, "jsonl")) == [(1, {"sku": "A"}), (3, None), (4, None)]
+
+
+@pytest.mark.django_db
+def test_category_segments_are_resolved_under_their_parent():
+    run_import([
+        {"sku": "A", "name": "Smartphone", "price": "100", "category": "electronics/phones"},
+        {"sku": "B", "name": "Toy phone", "price": "5", "category": "toys/phones"},
+    ])
+
+    parents = dict(Product.objects.values_list("sku", "category__parent__slug"))
+    assert parents == {"A": "electronics", "B": "toys"}
+    assert Category.objects.filter(slug="phones").count() == 2
+
+
+@pytest.mark.parametrize("stock", ["²", "-1", "1.5", "2147483648"])
+def test_bad_stock_is_a_row_error(stock):
+    with pytest.raises(RowError):
+        clean_row({"sku": "A", "name": "Alpha", "price": "1", "stock": stock})
@@ -0,0 +1,110 @@
+import importlib
+from decimal import Decimal
+
+import pytest
+from django.apps import apps
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from main.models import Order, OrderItem, OrderSummary, Product
+from main.services import OrderError, place_order
+
+
+@pytest.fixture
+def user(django_user_model):
+    return django_user_model.objects.create_user(email="buyer@example.com", password="secret123")
+
+
+@pytest.fixture
+def auth_client(client, user):
+    client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {RefreshToken.for_user(user).access_token}"
+    return client
+
+
+@pytest.fixture
+def products(db):
+    return [
+        Product.objects.create(
+            sku=f"SKU-{i}", name=f"Product {i}", price=Decimal("10.50"), stock=10,
+            image_url=f"https://img.example.com/{i}.png",
+        )
+        for i in range(3)
+    ]
+
+
+def test_place_order_writes_summary_and_decrements_stock(user, products):
+    order = place_order(user, [(products[1].pk, 2), (products[0].pk, 1), (products[1].pk, 1)])
+
+    summary = OrderSummary.objects.get(order=order)
+    assert (summary.item_count, summary.total) == (4, Decimal("42.00"))
+    assert summary.first_item_name == "Product 1"
+    assert summary.first_item_thumbnail == "https://img.example.com/1.png"
+    assert Product.objects.get(pk=products[1].pk).stock == 7
+
+    with pytest.raises(OrderError):
+        place_order(user, [(products[2].pk, 11)])
+    assert Order.objects.count() == 1
+
+
+def test_status_change_is_copied_to_summary(user, products):
+    order = place_order(user, [(products[0].pk, 1)])
+
+    order.status = Order.STATUS_SHIPPED
+    order.save()
+
+    assert OrderSummary.objects.get(order=order).status == Order.STATUS_SHIPPED
+
+
+def test_summary_follows_item_edits_and_bulk_updates(user, products):
+    order = place_order(user, [(products[0].pk, 1), (products[1].pk, 2)])
+
+    order.items.get(product=products[0]).delete()
+    Order.objects.filter(pk=order.pk).update(status=Order.STATUS_CANCELLED, total=Decimal("21.00"))
+
+    summary = OrderSummary.objects.get(order=order)
+    assert (summary.item_count, summary.first_item_name) == (2, "Product 1")
+    assert (summary.status, summary.total) == (Order.STATUS_CANCELLED, Decimal("21.00"))
+
+
+def test_order_history_is_keyset_paginated_from_summaries(auth_client, user, products, django_assert_num_queries):
+    for _ in range(3):
+        response = auth_client.post(
+            "/api/orders/", {"items": [{"product_id": products[0].pk, "quantity": 1}]},
+            content_type="application/json",
+        )
+        assert response.status_code == 201
+    other = type(user).objects.create_user(email="other@example.com", password="secret123")
+    place_order(other, [(products[0].pk, 1)])
+
+    # JWT user load + one range scan of the summary index
+    with django_assert_num_queries(2):
+        page = auth_client.get("/api/orders/?page_size=2").json()
+    assert len(page["results"]) == 2 and "cursor=" in page["next"]
+
+    rest = auth_client.get(page["next"]).json()
+    ids = [row["id"] for row in page["results"] + rest["results"]]
+    assert ids == sorted(Order.objects.filter(user=user).values_list("pk", flat=True), reverse=True)
+    assert rest["next"] is None
+
+
+def test_unavailable_product_is_rejected(auth_client, products):
+    products[0].is_active = False
+    products[0].save()
+
+    response = auth_client.post(
+        "/api/orders/", {"items": [{"product_id": products[0].pk, "quantity": 1}]},
+        content_type="application/json",
+    )
+
+    assert response.status_code == 400
+    assert "not available" in response.json()["error"]
+
+
+def test_backfill_creates_missing_summaries(user, products):
+    order = Order.objects.create(user=user, total=Decimal("21.00"))
+    OrderItem.objects.create(order=order, product=products[2], quantity=2, unit_price=Decimal("10.50"))
+
+    migration = importlib.import_module("main.migrations.0003_order_summary")
+    migration.backfill_summaries(apps, None)
+
+    summary = OrderSummary.objects.get(order=order)
+    assert (summary.item_count, summary.total, summary.first_item_name) == (2, Decimal("21.00"), "Product 2")
@@ -0,0 +1,82 @@
+import pytest
+from django.core.management import call_command
+
+from main import pincodes
+from main.pincodes import get_index, reset_index
+
+
+DATASET = """pincode,district,state,zone,serviceable,cod
+110001,New Delhi,Delhi,North,yes,yes
+560001,Bengaluru,Karnataka,South,yes,no
+799001,West Tripura,Tripura,North East,no,no
+"""
+
+
+@pytest.fixture
+def pincode_index(tmp_path, settings):
+    source = tmp_path / "pincodes.csv"
+    source.write_text(DATASET)
+    settings.PINCODE_INDEX_PATH = str(tmp_path / "pincodes.idx")
+    call_command("build_pincode_index", str(source))
+    reset_index()
+    yield get_index()
+    reset_index()
+
+
+def test_lookup_is_served_from_the_index(pincode_index):
+    info = pincode_index.lookup("560001")
+
+    assert len(pincode_index) == 3
+    assert (info.district, info.state, info.zone) == ("Bengaluru", "Karnataka", "South")
+    assert info.serviceable and not info.cod
+    assert pincode_index.lookup("560002") is None
+    assert pincode_index.lookup("012345") is None
+
+
+@pytest.mark.django_db
+def test_register_rejects_unknown_pin_code(client, pincode_index):
+    def register(email, pin_code):
+        return client.post(
+            "/api/accounts/register/",
+            {"email": email, "password": "secret123", "pin_code": pin_code},
+            content_type="application/json",
+        )
+
+    assert register("known@example.com", "110001").status_code == 201
+    response = register("unknown@example.com", "110002")
+    assert response.status_code == 400
+    assert "pin_code" in response.json()
+
+
+def test_batch_check(client, pincode_index):
+    response = client.post(
+        "/api/pincodes/check/", {"pin_codes": ["110001", "999999"]}, content_type="application/json"
+    )
+
+    results = response.json()["results"]
+    assert response.status_code == 200
+    assert results["110001"]["cod"] is True
+    assert results["999999"] is None
+
+
+def test_rebuilt_index_is_reopened(pincode_index, tmp_path, monkeypatch):
+    monkeypatch.setattr(pincodes, "RELOAD_CHECK_INTERVAL", 0)
+    source = tmp_path / "pincodes.csv"
+    source.write_text(DATASET.replace("North East,no,no", "North East,yes,no"))
+
+    assert get_index() is pincode_index
+    call_command("build_pincode_index", str(source))
+
+    index = get_index()
+    assert index is not pincode_index
+    assert index.lookup("799001").serviceable
+    assert not pincode_index.lookup("799001").serviceable  # old mapping stays readable
+
+
+def test_batch_check_without_dataset(client, settings, tmp_path):
+    settings.PINCODE_INDEX_PATH = str(tmp_path / "missing.idx")
+    reset_index()
+
+    response = client.post("/api/pincodes/check/", {"pin_codes": ["110001"]}, content_type="application/json")
+
+    assert response.status_code == 503
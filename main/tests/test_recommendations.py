@@ -0,0 +1,148 @@
+from datetime import timedelta
+from decimal import Decimal
+
+import pytest
+from django.core.management import call_command
+from django.utils import timezone
+
+from main import recommendations
+from main.catalog_import import CatalogImporter
+from main.models import Order, OrderItem, Product, ProductRecommendation, RecommendationState
+
+
+@pytest.fixture
+def products(db):
+    return [
+        Product.objects.create(sku=f"SKU-{i}", name=f"Product {i}", price=Decimal("10.00"))
+        for i in range(4)
+    ]
+
+
+@pytest.fixture
+def place(django_user_model):
+    user = django_user_model.objects.create_user(email="buyer@example.com", password="secret123")
+
+    def place(*products, status=Order.STATUS_PAID, age=timedelta(hours=1)):
+        order = Order.objects.create(user=user, status=status, created_at=timezone.now() - age)
+        for product in products:
+            OrderItem.objects.create(order=order, product=product, unit_price=product.price)
+        return order
+    return place
+
+
+def recommended(product):
+    return list(
+        ProductRecommendation.objects.filter(product=product).values_list("recommended__sku", flat=True)
+    )
+
+
+def test_recommendations_are_ranked_by_cosine_similarity(products, place, django_capture_on_commit_callbacks):
+    p0, p1, p2, p3 = products
+    place(p0, p1)
+    place(p0, p1)
+    place(p0, p2)
+    place(p2, p2, p3)                               # duplicate lines count once
+    place(p0, p3, status=Order.STATUS_CANCELLED)    # ignored
+
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("build_recommendations", "--batch-size", "2")
+
+    # cos(p0, p1) = 2 / sqrt(3 * 2) > cos(p0, p2) = 1 / sqrt(3 * 2)
+    assert recommended(p0) == ["SKU-1", "SKU-2"]
+    assert recommended(p3) == ["SKU-2"]
+
+
+def test_incremental_run_matches_full_rebuild(products, place, django_capture_on_commit_callbacks):
+    p0, p1, p2, _ = products
+    place(p0, p1)
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("build_recommendations")
+    place(p0, p2)
+    place(p0, p2)
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("build_recommendations")
+    incremental = recommended(p0)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("build_recommendations", "--full")
+
+    assert incremental == recommended(p0) == ["SKU-2", "SKU-1"]
+
+
+def test_watermark_never_passes_orders_inside_the_lag(products, place, django_capture_on_commit_callbacks):
+    p0, p1, p2, _ = products
+    place(p0, p1)
+    late = place(p0, p2, age=timedelta(0))   # lower pk, may not have committed yet
+    place(p0, p2)
+
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("build_recommendations")
+    assert recommended(p0) == ["SKU-1"]
+    assert RecommendationState.objects.get().last_order_id < late.pk
+
+    Order.objects.filter(pk=late.pk).update(created_at=timezone.now() - timedelta(hours=1))
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("build_recommendations")
+    assert recommended(p0) == ["SKU-2", "SKU-1"]
+
+
+def test_each_order_batch_commits_with_the_watermark(products, place, monkeypatch):
+    p0, p1, p2, _ = products
+    first = place(p0, p1)
+    place(p0, p2)
+
+    apply_pair_counts = recommendations.apply_pair_counts
+    calls = []
+    def fail_second_batch(pairs):
+        calls.append(pairs)
+        if len(calls) == 2:
+            raise RuntimeError("worker died")
+        apply_pair_counts(pairs)
+    monkeypatch.setattr(recommendations, "apply_pair_counts", fail_second_batch)
+
+    with pytest.raises(RuntimeError):
+        recommendations.build_recommendations(batch_size=1)
+
+    assert RecommendationState.objects.get().last_order_id == first.pk
+    monkeypatch.undo()
+    assert recommendations.build_recommendations(batch_size=1)["orders"] == 1
+    assert recommended(p0) == ["SKU-1", "SKU-2"]
+
+
+def test_endpoint_serves_precomputed_list_from_cache(
+    client, products, place, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    p0, p1, *_ = products
+    place(p0, p1)
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("build_recommendations")
+    url = f"/api/products/{p0.pk}/recommendations/"
+
+    with django_assert_num_queries(1):
+        response = client.get(url)
+    assert response.status_code == 200
+    assert [item["sku"] for item in response.json()["results"]] == ["SKU-1"]
+
+    with django_assert_num_queries(0):
+        assert client.get(url).json() == response.json()
+
+    assert client.get("/api/products/999999/recommendations/").status_code == 404
+
+
+def test_cached_list_drops_when_a_recommended_product_changes(
+    client, products, place, django_capture_on_commit_callbacks
+):
+    p0, p1, p2, _ = products
+    place(p0, p1, p2)
+    with django_capture_on_commit_callbacks(execute=True):
+        call_command("build_recommendations")
+    url = f"/api/products/{p0.pk}/recommendations/"
+    assert [item["sku"] for item in client.get(url).json()["results"]] == ["SKU-1", "SKU-2"]
+
+    p1.price = Decimal("99.00")
+    p1.save()
+    assert client.get(url).json()["results"][0]["price"] == "99.00"
+
+    with django_capture_on_commit_callbacks(execute=True):
+        CatalogImporter().run([(1, {"sku": "SKU-2", "name": "Product 2", "price": "10", "is_active": "no"})])
+    assert [item["sku"] for item in client.get(url).json()["results"]] == ["SKU-1"]
@@ -0,0 +1,14 @@
+from django.urls import path
+from .views import OrderListView, PincodeCheckView, ProductRecommendationsView
+
+
+urlpatterns = [
+    # Delivery / COD eligibility for many PIN codes in one call
+    path("pincodes/check/", PincodeCheckView.as_view(), name="pincode_check"),
+
+    # "Frequently bought together", precomputed by build_recommendations
+    path("products/<int:pk>/recommendations/", ProductRecommendationsView.as_view(), name="product_recommendations"),
+
+    # "My orders" (GET, keyset-paginated) and order placement (POST)
+    path("orders/", OrderListView.as_view(), name="orders"),
+]
@@ -0,0 +1,113 @@
+from django.conf import settings
+from rest_framework import generics, status
+from rest_framework.pagination import CursorPagination
+from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core.caching import cached_response
+from .models import OrderSummary, Product, ProductRecommendation
+from .pincodes import get_index
+from .recommendations import recommendations_tag
+from .serializers import (
+    OrderCreateSerializer,
+    OrderSummarySerializer,
+    PincodeCheckSerializer,
+    ProductRecommendationSerializer,
+)
+from .services import OrderError, place_order
+
+
+class PincodeCheckView(APIView):
+    """
+    Batch PIN-code Serviceability API
+
+    - Open endpoint (used on product pages before login).
+    - POST `{"pin_codes": [...]}` and get district/state/zone plus delivery and
+      COD flags for each code, or `null` for unknown codes.
+    - Served from the memory-mapped index; no database access.
+    """
+    permission_classes = [AllowAny]
+
+    def post(self, request):
+        serializer = PincodeCheckSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        index = get_index()
+        if index is None:
+            return Response(
+                {"error": "PIN-code data is not available"},
+                status=status.HTTP_503_SERVICE_UNAVAILABLE,
+            )
+
+        results = {}
+        for pin_code in serializer.validated_data["pin_codes"]:
+            info = index.lookup(pin_code)
+            results[pin_code] = info.as_dict() if info else None
+        return Response({"results": results}, status=status.HTTP_200_OK)
+
+
+class ProductRecommendationsView(APIView):
+    """
+    "Frequently bought together" API
+
+    - Open endpoint (product pages are public).
+    - GET returns the precomputed top-K neighbours of a product, best first.
+    - One query against `ProductRecommendation` (built offline by
+      `build_recommendations`); responses are cached until the next rebuild
+      or a change to any product in the list.
+    """
+    permission_classes = [AllowAny]
+
+    @cached_response(
+        key=lambda view, request, pk: f"recommendations:{pk}",
+        tags=lambda view, request, pk: [recommendations_tag(pk)],
+        timeout=getattr(settings, "RECOMMENDATIONS_CACHE_TIMEOUT", 3600),
+    )
+    def get(self, request, pk):
+        recommendations = (
+            ProductRecommendation.objects.filter(product_id=pk, recommended__is_active=True)
+            .select_related("recommended")
+            .order_by("rank")
+        )
+        data = ProductRecommendationSerializer(recommendations, many=True).data
+        if not data and not Product.objects.filter(pk=pk).exists():
+            return Response({"error": "Product not found"}, status=status.HTTP_404_NOT_FOUND)
+        return Response({"product": pk, "results": data}, status=status.HTTP_200_OK)
+
+
+class OrderHistoryPagination(CursorPagination):
+    """Keyset pagination over `order_summary_user_recent_idx`; no COUNT, no OFFSET."""
+    ordering = ("-created_at", "-order_id")
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+
+
+class OrderListView(generics.ListAPIView):
+    """
+    Order History / Placement API
+
+    - Authenticated users only; each user sees only their own orders.
+    - GET lists orders newest first from `OrderSummary` (no joins, no
+      aggregation), paginated with `?cursor=` links.
+    - POST `{"items": [{"product_id": 1, "quantity": 2}, ...]}` places an order.
+    """
+    serializer_class = OrderSummarySerializer
+    permission_classes = [IsAuthenticated]
+    pagination_class = OrderHistoryPagination
+
+    def get_queryset(self):
+        return OrderSummary.objects.filter(user=self.request.user)
+
+    def post(self, request, *args, **kwargs):
+        serializer = OrderCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        lines = [(line["product_id"], line["quantity"]) for line in serializer.validated_data["items"]]
+
+        try:
+            order = place_order(request.user, lines)
+        except OrderError as exc:
+            return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(OrderSummarySerializer(order.summary).data, status=status.HTTP_201_CREATED)